@@ -24,7 +24,8 @@ Architecture:
 from .interfaces import (
     UIConfig, ComponentTheme, LayoutMode, DeviceType,
     IUIComponent, IView, ILayout, IThemeManager,
-    UIEvent, ComponentState, AccessibilityFeatures
+    UIEvent, ComponentState, AccessibilityFeatures,
+    ColorScheme, FontSettings
 )
 from .components import (
     BaseComponent, Button, SelectMenu, Modal, ProgressBar,
@@ -34,14 +35,8 @@ from .views import (
     BaseView, AudioControlView, FavoritesView, SettingsView,
     StreamBrowserView, StatusView
 )
-from .layouts import (
-    ResponsiveLayout, MobileLayout, DesktopLayout,
-    CompactLayout, ExpandedLayout
-)
-from .themes import (
-    ThemeManager, DefaultTheme, DarkTheme, HighContrastTheme,
-    ColorScheme, FontSettings
-)
+from .layouts import ResponsiveLayout
+from .themes import ThemeManager
 
 # Audio-specific UI components
 from .audio import (
@@ -101,16 +96,9 @@ __all__ = [
     
     # Layouts
     'ResponsiveLayout',
-    'MobileLayout',
-    'DesktopLayout',
-    'CompactLayout',
-    'ExpandedLayout',
     
     # Themes
     'ThemeManager',
-    'DefaultTheme',
-    'DarkTheme',
-    'HighContrastTheme',
     'ColorScheme',
     'FontSettings',
     
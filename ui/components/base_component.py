@@ -15,14 +15,38 @@ Key Features:
 
 import logging
 import asyncio
-from typing import Dict, Any, Optional, Callable
+from typing import Dict, Any, Optional, Callable, Set
 from datetime import datetime, timezone
 import discord
 
-from ..interfaces import IUIComponent, ComponentTheme, ComponentState, UIEvent
+from ..interfaces import (
+    IUIComponent, ComponentTheme, ComponentState, UIEvent,
+    StateChangeEvent, EnabledChangeEvent, ValueChangeEvent, InteractionEvent,
+    UIEventData
+)
 
 logger = logging.getLogger('discord.ui.components.base')
 
+# Discord button style for each component state
+_BUTTON_STYLE_MAP = {
+    ComponentState.NORMAL: discord.ButtonStyle.secondary,
+    ComponentState.ACTIVE: discord.ButtonStyle.primary,
+    ComponentState.DISABLED: discord.ButtonStyle.secondary,
+    ComponentState.LOADING: discord.ButtonStyle.secondary,
+    ComponentState.ERROR: discord.ButtonStyle.danger,
+    ComponentState.SUCCESS: discord.ButtonStyle.success
+}
+
+# Theme color attribute used for embeds in each component state
+_STATE_COLOR_ATTR = {
+    ComponentState.NORMAL: 'secondary',
+    ComponentState.ACTIVE: 'primary',
+    ComponentState.DISABLED: 'secondary',
+    ComponentState.LOADING: 'warning',
+    ComponentState.ERROR: 'error',
+    ComponentState.SUCCESS: 'success'
+}
+
 class BaseComponent(IUIComponent):
     """
     Abstract base implementation for all UI components.
@@ -31,6 +55,14 @@ class BaseComponent(IUIComponent):
     event handling, and accessibility features that all components need.
     """
     
+    __slots__ = (
+        'component_id', 'theme', 'state', 'enabled', 'visible', 'value',
+        '_event_handlers', '_interaction_callback', '_interaction_callback_is_coro',
+        '_pending_tasks', '_cached_button_style', '_cached_color', '_cached_color_theme',
+        '_accessibility_label', '_accessibility_description',
+        '_touch_friendly', '_mobile_optimized', '_created_at', '_last_updated'
+    )
+    
     def __init__(self, component_id: str, theme: ComponentTheme):
         self.component_id = component_id
         self.theme = theme
@@ -42,6 +74,13 @@ class BaseComponent(IUIComponent):
         # Event handling
         self._event_handlers: Dict[UIEvent, list] = {}
         self._interaction_callback: Optional[Callable] = None
+        self._interaction_callback_is_coro = False
+        self._pending_tasks: Set[asyncio.Task] = set()
+        
+        # Cached state-derived styling, invalidated on state/theme change
+        self._cached_button_style: Optional[discord.ButtonStyle] = None
+        self._cached_color: Optional[int] = None
+        self._cached_color_theme: Optional[ComponentTheme] = None
         
         # Accessibility
         self._accessibility_label: Optional[str] = None
@@ -65,78 +104,104 @@ class BaseComponent(IUIComponent):
         """
         raise NotImplementedError("Subclasses must implement render()")
     
-    async def update_state(self, state: ComponentState) -> None:
+    def update_state(self, state: ComponentState) -> None:
         """
         Update component visual state.
         
+        Setting the state the component is already in is a no-op and
+        does not emit a COMPONENT_CHANGED event.
+        
         Args:
             state: New component state
         """
+        if state is self.state:
+            return
+        
         old_state = self.state
         self.state = state
+        self._invalidate_style_cache()
         self._last_updated = datetime.now(timezone.utc)
         
         # Emit state change event
-        await self._emit_event(UIEvent.COMPONENT_CHANGED, {
-            'component_id': self.component_id,
-            'old_state': old_state.value,
-            'new_state': state.value,
-            'timestamp': self._last_updated
-        })
+        self._schedule_event(UIEvent.COMPONENT_CHANGED, StateChangeEvent(
+            self.component_id, old_state.value, state.value, self._last_updated
+        ))
         
         logger.debug(f"Component {self.component_id} state changed: {old_state.value} -> {state.value}")
     
-    async def set_enabled(self, enabled: bool) -> None:
+    def set_enabled(self, enabled: bool) -> None:
         """
         Enable or disable the component.
         
+        Re-applying the current enabled flag is a no-op.
+        
         Args:
             enabled: Whether the component should be enabled
         """
+        if enabled == self.enabled:
+            return
+        
         old_enabled = self.enabled
+        old_state = self.state
         self.enabled = enabled
         self._last_updated = datetime.now(timezone.utc)
         
-        # Update state based on enabled status
-        if not enabled and self.state != ComponentState.DISABLED:
-            await self.update_state(ComponentState.DISABLED)
-        elif enabled and self.state == ComponentState.DISABLED:
-            await self.update_state(ComponentState.NORMAL)
+        # Update state based on enabled status in place so a single
+        # logical change emits a single event
+        if not enabled and old_state is not ComponentState.DISABLED:
+            self.state = ComponentState.DISABLED
+        elif enabled and old_state is ComponentState.DISABLED:
+            self.state = ComponentState.NORMAL
+        
+        if self.state is not old_state:
+            self._invalidate_style_cache()
+            self._schedule_event(UIEvent.COMPONENT_CHANGED, EnabledChangeEvent(
+                self.component_id, old_enabled, enabled,
+                old_state.value, self.state.value, self._last_updated
+            ))
         
         logger.debug(f"Component {self.component_id} enabled: {old_enabled} -> {enabled}")
     
-    async def get_value(self) -> Any:
+    def get_value(self) -> Any:
         """Get current component value"""
         return self.value
     
-    async def set_value(self, value: Any) -> None:
+    def set_value(self, value: Any) -> None:
         """
         Set component value.
         
+        Setting the identical value object again is a no-op and does not
+        emit a COMPONENT_CHANGED event.
+        
         Args:
             value: New value for the component
         """
+        if value is self.value:
+            return
+        
         old_value = self.value
         self.value = value
         self._last_updated = datetime.now(timezone.utc)
         
         # Emit value change event
-        await self._emit_event(UIEvent.COMPONENT_CHANGED, {
-            'component_id': self.component_id,
-            'old_value': old_value,
-            'new_value': value,
-            'timestamp': self._last_updated
-        })
+        self._schedule_event(UIEvent.COMPONENT_CHANGED, ValueChangeEvent(
+            self.component_id, old_value, value, self._last_updated
+        ))
         
         logger.debug(f"Component {self.component_id} value changed: {old_value} -> {value}")
     
-    async def set_visible(self, visible: bool) -> None:
+    def set_visible(self, visible: bool) -> None:
         """
         Set component visibility.
         
+        Re-applying the current visibility is a no-op.
+        
         Args:
             visible: Whether the component should be visible
         """
+        if visible == self.visible:
+            return
+        
         old_visible = self.visible
         self.visible = visible
         self._last_updated = datetime.now(timezone.utc)
@@ -188,11 +253,21 @@ class BaseComponent(IUIComponent):
         Returns:
             True if handler was removed, False if not found
         """
-        if event in self._event_handlers and handler in self._event_handlers[event]:
-            self._event_handlers[event].remove(handler)
-            logger.debug(f"Removed event handler for {event.value} on component {self.component_id}")
-            return True
-        return False
+        handlers = self._event_handlers.get(event)
+        if handlers is None:
+            return False
+        
+        try:
+            handlers.remove(handler)
+        except ValueError:
+            return False
+        
+        # Drop empty buckets so emission can skip events without listeners
+        if not handlers:
+            del self._event_handlers[event]
+        
+        logger.debug(f"Removed event handler for {event.value} on component {self.component_id}")
+        return True
     
     def set_interaction_callback(self, callback: Callable) -> None:
         """
@@ -202,6 +277,7 @@ class BaseComponent(IUIComponent):
             callback: Callback function for interactions
         """
         self._interaction_callback = callback
+        self._interaction_callback_is_coro = asyncio.iscoroutinefunction(callback)
         logger.debug(f"Set interaction callback for component {self.component_id}")
     
     async def handle_interaction(self, interaction: discord.Interaction) -> None:
@@ -212,17 +288,18 @@ class BaseComponent(IUIComponent):
             interaction: Discord interaction object
         """
         try:
-            # Emit interaction event
-            await self._emit_event(UIEvent.COMPONENT_CLICKED, {
-                'component_id': self.component_id,
-                'user_id': interaction.user.id,
-                'guild_id': interaction.guild.id if interaction.guild else None,
-                'timestamp': datetime.now(timezone.utc)
-            })
+            # Emit interaction event only when someone is listening
+            if self._event_handlers and UIEvent.COMPONENT_CLICKED in self._event_handlers:
+                self._schedule_event(UIEvent.COMPONENT_CLICKED, InteractionEvent(
+                    self.component_id,
+                    interaction.user.id,
+                    interaction.guild_id,
+                    datetime.now(timezone.utc)
+                ))
             
             # Call registered interaction callback
             if self._interaction_callback:
-                if asyncio.iscoroutinefunction(self._interaction_callback):
+                if self._interaction_callback_is_coro:
                     await self._interaction_callback(interaction, self)
                 else:
                     self._interaction_callback(interaction, self)
@@ -230,9 +307,9 @@ class BaseComponent(IUIComponent):
         except Exception as e:
             logger.error(f"Error handling interaction for component {self.component_id}: {e}")
             # Update component to error state
-            await self.update_state(ComponentState.ERROR)
+            self.update_state(ComponentState.ERROR)
     
-    async def _emit_event(self, event: UIEvent, data: Dict[str, Any]) -> None:
+    async def _emit_event(self, event: UIEvent, data: UIEventData) -> None:
         """
         Emit event to registered handlers.
         
@@ -253,6 +330,28 @@ class BaseComponent(IUIComponent):
         except Exception as e:
             logger.error(f"Error emitting event {event.value}: {e}")
     
+    def _schedule_event(self, event: UIEvent, data: UIEventData) -> None:
+        """
+        Emit event to registered handlers in the background.
+        
+        The caller does not wait for handlers to complete; use
+        _emit_event() directly when handler completion matters. Requires
+        a running event loop whenever handlers are registered.
+        
+        Args:
+            event: Event type
+            data: Event data
+        """
+        if self._event_handlers and self._event_handlers.get(event):
+            task = asyncio.create_task(self._emit_event(event, data))
+            self._pending_tasks.add(task)
+            task.add_done_callback(self._pending_tasks.discard)
+    
+    def _invalidate_style_cache(self) -> None:
+        """Drop cached button style and color after a state or theme change"""
+        self._cached_button_style = None
+        self._cached_color = None
+    
     def _get_button_style(self) -> discord.ButtonStyle:
         """
         Get appropriate Discord button style based on component state.
@@ -260,16 +359,11 @@ class BaseComponent(IUIComponent):
         Returns:
             Discord button style
         """
-        if self.state == ComponentState.DISABLED:
-            return discord.ButtonStyle.secondary
-        elif self.state == ComponentState.ACTIVE:
-            return discord.ButtonStyle.primary
-        elif self.state == ComponentState.ERROR:
-            return discord.ButtonStyle.danger
-        elif self.state == ComponentState.SUCCESS:
-            return discord.ButtonStyle.success
-        else:
-            return discord.ButtonStyle.secondary
+        if self._cached_button_style is None:
+            self._cached_button_style = _BUTTON_STYLE_MAP.get(
+                self.state, discord.ButtonStyle.secondary
+            )
+        return self._cached_button_style
     
     def _get_component_color(self) -> int:
         """
@@ -278,16 +372,11 @@ class BaseComponent(IUIComponent):
         Returns:
             Color integer for Discord embeds
         """
-        if self.state == ComponentState.ACTIVE:
-            return int(self.theme.colors.primary.replace('#', ''), 16)
-        elif self.state == ComponentState.ERROR:
-            return int(self.theme.colors.error.replace('#', ''), 16)
-        elif self.state == ComponentState.SUCCESS:
-            return int(self.theme.colors.success.replace('#', ''), 16)
-        elif self.state == ComponentState.LOADING:
-            return int(self.theme.colors.warning.replace('#', ''), 16)
-        else:
-            return int(self.theme.colors.secondary.replace('#', ''), 16)
+        if self._cached_color is None or self._cached_color_theme is not self.theme:
+            color = getattr(self.theme.colors, _STATE_COLOR_ATTR.get(self.state, 'secondary'))
+            self._cached_color = int(color.replace('#', ''), 16)
+            self._cached_color_theme = self.theme
+        return self._cached_color
     
     def _should_use_emoji(self) -> bool:
         """
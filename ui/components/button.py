@@ -15,14 +15,58 @@ Button Types:
 
 import logging
 import asyncio
-from typing import Optional, Callable, Any, Dict
+import functools
+from typing import Optional, Callable, Any, Dict, List
 import discord
 
 from .base_component import BaseComponent
-from ..interfaces import ComponentTheme, ComponentState, UI_CONSTANTS
+from ..interfaces import ComponentTheme, ComponentState, MAX_BUTTON_LABEL_LENGTH
 
 logger = logging.getLogger('discord.ui.components.button')
 
+# StreamService class, imported on first use: importing it while the ui package
+# is still initializing would be circular (services -> ui_service -> ui.components)
+_stream_service_class = None
+
+def _get_stream_service_class():
+    """Return the StreamService class, or None if it cannot be imported"""
+    global _stream_service_class
+    if _stream_service_class is None:
+        try:
+            from services.stream_service import StreamService
+        except ImportError as e:
+            logger.warning(f"Could not import StreamService for favorite buttons: {e}")
+            return None
+        _stream_service_class = StreamService
+    return _stream_service_class
+
+# Marks a FavoriteButton whose StreamService has not been resolved by the caller
+_UNRESOLVED = object()
+
+@functools.lru_cache(maxsize=256)
+def _confirm_embed_payload(label: str, color: int) -> Dict[str, Any]:
+    """
+    Build the confirmation embed payload for an action label and color.
+    
+    The cached dict is shared by every caller and must not be mutated.
+    Embed.from_dict does not deep-copy its input, so pass it a copy; the
+    payload holds only flat values, so dict() is enough.
+    """
+    return discord.Embed(
+        title="Confirm Action",
+        description=f"Are you sure you want to {label.lower()}?",
+        color=color
+    ).to_dict()
+
+# Audio-specific button styling
+_AUDIO_STYLE_MAP = {
+    'play': discord.ButtonStyle.success,
+    'pause': discord.ButtonStyle.secondary,
+    'stop': discord.ButtonStyle.danger,
+    'skip': discord.ButtonStyle.primary,
+    'volume': discord.ButtonStyle.secondary
+}
+
 class Button(BaseComponent):
     """
     Enhanced button component with theming and state management.
@@ -31,6 +75,12 @@ class Button(BaseComponent):
     accessibility features, and mobile optimization.
     """
     
+    __slots__ = (
+        'label', 'emoji', 'custom_style', '_original_label', '_max_label_length',
+        '_show_state_emoji', '_discord_button', '_dirty', '_cached_display_label',
+        '_reset_handle'
+    )
+    
     def __init__(self, component_id: str, theme: ComponentTheme, label: str, 
                  emoji: Optional[str] = None, style: Optional[discord.ButtonStyle] = None):
         super().__init__(component_id, theme)
@@ -40,9 +90,17 @@ class Button(BaseComponent):
         self._original_label = label
         
         # Button-specific settings
-        self._max_label_length = UI_CONSTANTS['MAX_BUTTON_LABEL_LENGTH']
+        self._max_label_length = MAX_BUTTON_LABEL_LENGTH
         self._show_state_emoji = True
         
+        # Rendered Discord button, reused across renders and refreshed when dirty
+        self._discord_button: Optional[discord.ui.Button] = None
+        self._dirty = True
+        self._cached_display_label: Optional[str] = None
+        
+        # Pending timer that returns SUCCESS/ERROR feedback to NORMAL
+        self._reset_handle: Optional[asyncio.TimerHandle] = None
+        
         logger.debug(f"Created button {component_id} with label '{label}'")
     
     async def render(self, **kwargs) -> discord.ui.Button:
@@ -53,24 +111,37 @@ class Button(BaseComponent):
             Discord UI Button component
         """
         try:
+            if self._discord_button is not None and not self._dirty:
+                return self._discord_button
+            
             # Determine button style
             style = self.custom_style if self.custom_style else self._get_button_style()
             
             # Prepare label with state emoji if enabled
             display_label = self._prepare_display_label()
             
-            # Create Discord button
-            button = discord.ui.Button(
-                style=style,
-                label=display_label,
-                emoji=self.emoji,
-                disabled=not self.enabled,
-                custom_id=self.component_id
-            )
-            
-            # Set interaction callback
-            button.callback = self._button_callback
-            
+            if self._discord_button is None:
+                # Create Discord button once
+                button = discord.ui.Button(
+                    style=style,
+                    label=display_label,
+                    emoji=self.emoji,
+                    disabled=not self.enabled,
+                    custom_id=self.component_id
+                )
+                
+                # Set interaction callback
+                button.callback = self._button_callback
+                self._discord_button = button
+            else:
+                # Refresh the existing button in place
+                button = self._discord_button
+                button.style = style
+                button.label = display_label
+                button.emoji = self.emoji
+                button.disabled = not self.enabled
+            
+            self._dirty = False
             return button
             
         except Exception as e:
@@ -93,6 +164,7 @@ class Button(BaseComponent):
         old_label = self.label
         self.label = label
         self._original_label = label
+        self._mark_dirty()
         
         logger.debug(f"Button {self.component_id} label changed: '{old_label}' -> '{label}'")
     
@@ -105,6 +177,7 @@ class Button(BaseComponent):
         """
         old_emoji = self.emoji
         self.emoji = emoji
+        self._mark_dirty()
         
         logger.debug(f"Button {self.component_id} emoji changed: '{old_emoji}' -> '{emoji}'")
     
@@ -116,6 +189,34 @@ class Button(BaseComponent):
             show: Whether to show state emoji
         """
         self._show_state_emoji = show
+        self._mark_dirty()
+    
+    def update_state(self, state: ComponentState) -> None:
+        """
+        Update button visual state and mark the rendered button stale.
+        
+        Args:
+            state: New component state
+        """
+        if state is not self.state:
+            self._mark_dirty()
+        super().update_state(state)
+    
+    def set_enabled(self, enabled: bool) -> None:
+        """
+        Enable or disable the button and mark the rendered button stale.
+        
+        Args:
+            enabled: Whether the button should be enabled
+        """
+        if enabled != self.enabled:
+            self._mark_dirty()
+        super().set_enabled(enabled)
+    
+    def _mark_dirty(self) -> None:
+        """Mark the rendered button and display label as stale"""
+        self._dirty = True
+        self._cached_display_label = None
     
     def _prepare_display_label(self) -> str:
         """
@@ -124,6 +225,9 @@ class Button(BaseComponent):
         Returns:
             Formatted label for display
         """
+        if self._cached_display_label is not None:
+            return self._cached_display_label
+        
         label = self.label
         
         # Add state emoji if enabled
@@ -133,7 +237,33 @@ class Button(BaseComponent):
                 label = f"{state_emoji} {label}"
         
         # Truncate if necessary
-        return self._truncate_text(label, self._max_label_length)
+        if len(label) > self._max_label_length:
+            label = self._truncate_text(label, self._max_label_length)
+        self._cached_display_label = label
+        return self._cached_display_label
+    
+    def _schedule_reset(self, delay: float) -> None:
+        """
+        Reset button state to normal after a delay.
+        
+        Re-arming cancels any pending reset so bursts of clicks share a
+        single timer instead of racing each other.
+        
+        Args:
+            delay: Delay in seconds
+        """
+        if self._reset_handle is not None:
+            self._reset_handle.cancel()
+        self._reset_handle = asyncio.get_running_loop().call_later(delay, self._do_reset)
+    
+    def _do_reset(self) -> None:
+        """Return SUCCESS/ERROR feedback state to NORMAL"""
+        self._reset_handle = None
+        try:
+            if self.state in (ComponentState.SUCCESS, ComponentState.ERROR):
+                self.update_state(ComponentState.NORMAL)
+        except Exception as e:
+            logger.error(f"Error resetting state for {self.component_id}: {e}")
     
     async def _button_callback(self, interaction: discord.Interaction) -> None:
         """
@@ -144,18 +274,20 @@ class Button(BaseComponent):
         """
         try:
             # Update button state to show it was clicked
-            await self.update_state(ComponentState.ACTIVE)
+            was_active = self.state is ComponentState.ACTIVE
+            self.update_state(ComponentState.ACTIVE)
             
             # Handle the interaction through base class
             await self.handle_interaction(interaction)
             
-            # Reset state after a brief moment (if not overridden)
-            if self.state == ComponentState.ACTIVE:
-                await self.update_state(ComponentState.NORMAL)
+            # Reset state only if the click itself activated the button and
+            # the interaction did not move it to another state
+            if not was_active and self.state is ComponentState.ACTIVE:
+                self.update_state(ComponentState.NORMAL)
                 
         except Exception as e:
             logger.error(f"Error in button callback for {self.component_id}: {e}")
-            await self.update_state(ComponentState.ERROR)
+            self.update_state(ComponentState.ERROR)
 
 class ActionButton(Button):
     """
@@ -165,6 +297,8 @@ class ActionButton(Button):
     actions, including optional confirmation dialogs and success/error feedback.
     """
     
+    __slots__ = ('action', 'confirm_required', 'success_message', 'error_message')
+    
     def __init__(self, component_id: str, theme: ComponentTheme, label: str,
                  action: Callable, confirm_required: bool = False,
                  success_message: Optional[str] = None,
@@ -188,63 +322,55 @@ class ActionButton(Button):
         Args:
             interaction: Discord interaction object
         """
-        try:
-            # Show confirmation if required
-            if self.confirm_required:
-                confirmed = await self._show_confirmation(interaction)
-                if not confirmed:
-                    return
-            
-            # Update state to show action is in progress
-            await self.update_state(ComponentState.LOADING)
-            
-            # Acknowledge the interaction first
-            if not interaction.response.is_done():
+        # Show confirmation if required (failures are reported as not confirmed)
+        if self.confirm_required and not await self._show_confirmation(interaction):
+            return
+        
+        # Update state to show action is in progress
+        self.update_state(ComponentState.LOADING)
+        
+        # Acknowledge the interaction first
+        if not interaction.response.is_done():
+            try:
                 await interaction.response.defer()
-            
-            # Execute the action
+            except discord.HTTPException as e:
+                logger.error(f"Failed to defer interaction for {self.component_id}: {e}")
+        
+        # Execute the action - user code, so any exception is possible
+        action_error: Optional[Exception] = None
+        if self.action:
             try:
-                result = None
-                if self.action:
-                    if asyncio.iscoroutinefunction(self.action):
-                        result = await self.action(interaction, self)
-                    else:
-                        result = self.action(interaction, self)
-                
-                # Show success state and message
-                await self.update_state(ComponentState.SUCCESS)
-                
-                # Send success message if not already responded
-                if interaction.followup:
-                    await interaction.followup.send(
-                        self.success_message,
-                        ephemeral=True
-                    )
-                
-                # Reset state after success
-                asyncio.create_task(self._reset_state_after_delay(2.0))
-                
-            except Exception as action_error:
-                logger.error(f"Action failed for button {self.component_id}: {action_error}")
-                
-                # Show error state and message
-                await self.update_state(ComponentState.ERROR)
-                
-                if interaction.followup:
-                    await interaction.followup.send(
-                        f"{self.error_message}: {str(action_error)}",
-                        ephemeral=True
-                    )
-                
-                # Reset state after error
-                asyncio.create_task(self._reset_state_after_delay(3.0))
-            
-            # Handle the interaction through base class
-            await self.handle_interaction(interaction)
-            
-        except Exception as e:
-            logger.error(f"Error in action button callback for {self.component_id}: {e}")
-            await self.update_state(ComponentState.ERROR)
+                if asyncio.iscoroutinefunction(self.action):
+                    await self.action(interaction, self)
+                else:
+                    self.action(interaction, self)
+            except Exception as e:
+                action_error = e
+        
+        if action_error is None:
+            # Show success state and message
+            self.update_state(ComponentState.SUCCESS)
+            message = self.success_message
+            reset_delay = 2.0
+        else:
+            logger.error(f"Action failed for button {self.component_id}: {action_error}")
+            
+            # Show error state and message
+            self.update_state(ComponentState.ERROR)
+            message = f"{self.error_message}: {str(action_error)}"
+            reset_delay = 3.0
+        
+        if interaction.followup is not None:
+            try:
+                await interaction.followup.send(message, ephemeral=True)
+            except discord.HTTPException as e:
+                logger.error(f"Failed to send followup for {self.component_id}: {e}")
+        
+        # Reset state after feedback
+        self._schedule_reset(reset_delay)
+        
+        # Handle the interaction through base class
+        await self.handle_interaction(interaction)
     
     async def _show_confirmation(self, interaction: discord.Interaction) -> bool:
         """
@@ -257,11 +383,9 @@ class ActionButton(Button):
             True if user confirmed, False otherwise
         """
         try:
-            # Create confirmation embed
-            embed = discord.Embed(
-                title="Confirm Action",
-                description=f"Are you sure you want to {self.label.lower()}?",
-                color=self._get_component_color()
+            # Create confirmation embed from a copy of the cached payload
+            embed = discord.Embed.from_dict(
+                dict(_confirm_embed_payload(self.label, self._get_component_color()))
             )
             
             # Create confirmation view
@@ -275,27 +399,11 @@ class ActionButton(Button):
             )
             
             # Wait for user response
-            await view.wait()
-            
-            return view.confirmed
+            return await view.wait_for_decision()
             
         except Exception as e:
             logger.error(f"Error showing confirmation for {self.component_id}: {e}")
             return False
-    
-    async def _reset_state_after_delay(self, delay: float) -> None:
-        """
-        Reset button state to normal after a delay.
-        
-        Args:
-            delay: Delay in seconds
-        """
-        try:
-            await asyncio.sleep(delay)
-            if self.state in [ComponentState.SUCCESS, ComponentState.ERROR]:
-                await self.update_state(ComponentState.NORMAL)
-        except Exception as e:
-            logger.error(f"Error resetting state for {self.component_id}: {e}")
 
 class NavigationButton(Button):
     """
@@ -305,6 +413,8 @@ class NavigationButton(Button):
     page tracking and disabled state management.
     """
     
+    __slots__ = ('target_view', 'current_page', 'target_page')
+    
     def __init__(self, component_id: str, theme: ComponentTheme, label: str,
                  target_view: str, current_page: int = 0, target_page: int = 0,
                  emoji: Optional[str] = None):
@@ -334,7 +444,7 @@ class NavigationButton(Button):
         self.target_page = target_page
         
         # Update enabled state based on page comparison
-        await self.set_enabled(current_page != target_page)
+        self.set_enabled(current_page != target_page)
         
         logger.debug(f"Navigation button {self.component_id} pages updated: {current_page} -> {target_page}")
 
@@ -346,6 +456,8 @@ class AudioButton(Button):
     the audio processing pipeline.
     """
     
+    __slots__ = ('audio_action', 'stream_id')
+    
     def __init__(self, component_id: str, theme: ComponentTheme, label: str,
                  audio_action: str, stream_id: Optional[str] = None,
                  emoji: Optional[str] = None):
@@ -354,14 +466,7 @@ class AudioButton(Button):
         self.stream_id = stream_id
         
         # Set audio-specific styling
-        audio_style_map = {
-            'play': discord.ButtonStyle.success,
-            'pause': discord.ButtonStyle.secondary,
-            'stop': discord.ButtonStyle.danger,
-            'skip': discord.ButtonStyle.primary,
-            'volume': discord.ButtonStyle.secondary
-        }
-        self.custom_style = audio_style_map.get(audio_action, discord.ButtonStyle.secondary)
+        self.custom_style = _AUDIO_STYLE_MAP.get(audio_action, discord.ButtonStyle.secondary)
         
         logger.debug(f"Created audio button {component_id}: action={audio_action}")
     
@@ -372,26 +477,21 @@ class AudioButton(Button):
         Args:
             interaction: Discord interaction object
         """
-        try:
-            # Update state to show audio action is in progress
-            await self.update_state(ComponentState.LOADING)
-            
-            # Execute audio action through  audio system
-            success = await self._execute_audio_action(interaction)
-            
-            if success:
-                await self.update_state(ComponentState.SUCCESS)
-                asyncio.create_task(self._reset_state_after_delay(1.5))
-            else:
-                await self.update_state(ComponentState.ERROR)
-                asyncio.create_task(self._reset_state_after_delay(2.0))
-            
-            # Handle the interaction through base class
-            await self.handle_interaction(interaction)
-            
-        except Exception as e:
-            logger.error(f"Error in audio button callback for {self.component_id}: {e}")
-            await self.update_state(ComponentState.ERROR)
+        # Update state to show audio action is in progress
+        self.update_state(ComponentState.LOADING)
+        
+        # Execute audio action through  audio system (reports failure as False)
+        success = await self._execute_audio_action(interaction)
+        
+        if success:
+            self.update_state(ComponentState.SUCCESS)
+            self._schedule_reset(1.5)
+        else:
+            self.update_state(ComponentState.ERROR)
+            self._schedule_reset(2.0)
+        
+        # Handle the interaction through base class
+        await self.handle_interaction(interaction)
     
     async def _execute_audio_action(self, interaction: discord.Interaction) -> bool:
         """
@@ -422,15 +522,6 @@ class AudioButton(Button):
         except Exception as e:
             logger.error(f"Audio action failed for {self.component_id}: {e}")
             return False
-    
-    async def _reset_state_after_delay(self, delay: float) -> None:
-        """Reset button state after delay"""
-        try:
-            await asyncio.sleep(delay)
-            if self.state in [ComponentState.SUCCESS, ComponentState.ERROR]:
-                await self.update_state(ComponentState.NORMAL)
-        except Exception as e:
-            logger.error(f"Error resetting audio button state: {e}")
 
 class FavoriteButton(Button):
     """
@@ -440,9 +531,15 @@ class FavoriteButton(Button):
     state management, and integration with the enhanced UI system.
     """
     
+    __slots__ = (
+        'favorite_number', 'station_name', 'stream_url', 'category',
+        'service_registry', 'stream_service'
+    )
+    
     def __init__(self, component_id: str, theme: ComponentTheme, 
                  favorite_number: int, station_name: str, stream_url: str,
-                 service_registry, category: Optional[str] = None):
+                 service_registry, category: Optional[str] = None,
+                 stream_service: Any = _UNRESOLVED):
         # Create label with favorite number and station name
         label = f"{favorite_number}. {station_name}"
         
@@ -454,22 +551,43 @@ class FavoriteButton(Button):
         self.category = category
         self.service_registry = service_registry
         
-        # Get StreamService from service registry using proper class type
-        try:
-            from services.stream_service import StreamService
-            self.stream_service = service_registry.get_optional(StreamService)
-        except ImportError:
-            logger.warning(f"Could not import StreamService for button {component_id}")
-            self.stream_service = None
+        # Get StreamService from service registry unless already resolved by the caller
+        if stream_service is _UNRESOLVED:
+            stream_service_class = _get_stream_service_class()
+            stream_service = service_registry.get_optional(stream_service_class) if stream_service_class else None
+            
+            if not stream_service:
+                logger.warning(f"StreamService not available for button {component_id}")
         
-        if not self.stream_service:
-            logger.warning(f"StreamService not available for button {component_id}")
+        self.stream_service = stream_service
         
         # Set styling for favorite buttons
         self.custom_style = discord.ButtonStyle.primary
         
         logger.debug(f"Created favorite button {component_id}: #{favorite_number} {station_name}")
     
+    @classmethod
+    def create_many(cls, service_registry, specs: List[Dict[str, Any]]) -> List['FavoriteButton']:
+        """
+        Create several favorite buttons sharing one StreamService lookup.
+        
+        Args:
+            service_registry: Service registry used to resolve StreamService
+            specs: Keyword arguments for each button, excluding service_registry
+            
+        Returns:
+            List of favorite buttons in spec order
+        """
+        stream_service_class = _get_stream_service_class()
+        stream_service = service_registry.get_optional(stream_service_class) if stream_service_class else None
+        if not stream_service:
+            logger.warning(f"StreamService not available for {len(specs)} favorite buttons")
+        
+        return [
+            cls(service_registry=service_registry, stream_service=stream_service, **spec)
+            for spec in specs
+        ]
+    
     async def _button_callback(self, interaction: discord.Interaction) -> None:
         """
         Handle favorite button click to play the station.
@@ -477,43 +595,85 @@ class FavoriteButton(Button):
         Args:
             interaction: Discord interaction object
         """
+        # Validate voice prerequisites before announcing playback
+        prerequisite_error = self._check_voice_prerequisites(interaction)
+        if prerequisite_error:
+            self.update_state(ComponentState.ERROR)
+            try:
+                await interaction.response.send_message(prerequisite_error, ephemeral=True)
+            except discord.HTTPException as e:
+                logger.error(f"Failed to respond for favorite button {self.component_id}: {e}")
+            self._schedule_reset(3.0)
+            await self.handle_interaction(interaction)
+            return
+        
+        # Update state to show action is in progress
+        self.update_state(ComponentState.LOADING)
+        
+        # Acknowledge interaction
         try:
-            # Update state to show action is in progress
-            await self.update_state(ComponentState.LOADING)
-            
-            # Acknowledge interaction
             await interaction.response.send_message(
                 f"🎵 Starting **{self.station_name}** (Favorite #{self.favorite_number})",
                 ephemeral=False
             )
+        except discord.HTTPException as e:
+            logger.error(f"Error in favorite button callback for {self.component_id}: {e}")
+            self.update_state(ComponentState.ERROR)
+            self._schedule_reset(3.0)
+            return
+        
+        # Start playing the favorite through existing system (reports failure as False)
+        success = await self._play_favorite(interaction)
+        
+        if success:
+            self.update_state(ComponentState.SUCCESS)
+            self._schedule_reset(2.0)
+        else:
+            self.update_state(ComponentState.ERROR)
             
-            # Start playing the favorite through existing system
-            success = await self._play_favorite(interaction)
-            
-            if success:
-                await self.update_state(ComponentState.SUCCESS)
-                asyncio.create_task(self._reset_state_after_delay(2.0))
-            else:
-                await self.update_state(ComponentState.ERROR)
-                
-                if interaction.followup:
+            if interaction.followup is not None:
+                try:
                     await interaction.followup.send(
                         f"❌ Failed to play {self.station_name}",
                         ephemeral=True
                     )
-                asyncio.create_task(self._reset_state_after_delay(3.0))
-            
-            # Handle the interaction through base class
-            await self.handle_interaction(interaction)
+                except discord.HTTPException as e:
+                    logger.error(f"Failed to send followup for {self.component_id}: {e}")
+            self._schedule_reset(3.0)
+        
+        # Handle the interaction through base class
+        await self.handle_interaction(interaction)
+    
+    def _check_voice_prerequisites(self, interaction: discord.Interaction) -> Optional[str]:
+        """
+        Check that the favorite can be played for this interaction.
+        
+        Args:
+            interaction: Discord interaction object
             
-        except Exception as e:
-            logger.error(f"Error in favorite button callback for {self.component_id}: {e}")
-            await self.update_state(ComponentState.ERROR)
+        Returns:
+            Error message for the user, or None if playback can start
+        """
+        # Check if user is in voice channel (handle both Member and User types)
+        user_voice = getattr(interaction.user, 'voice', None)
+        if not user_voice or not user_voice.channel:
+            return "😢 You are not in a voice channel. Where am I supposed to go?"
+        
+        # Check if bot is already playing
+        if interaction.guild:
+            voice_client = interaction.guild.voice_client
+            if voice_client and hasattr(voice_client, 'is_playing') and voice_client.is_playing():
+                return "😱 I'm already playing music! I can't be in two places at once"
+        
+        return None
     
     async def _play_favorite(self, interaction: discord.Interaction) -> bool:
         """
         Play the favorite station using StreamService through service registry.
         
+        Voice prerequisites are checked by the caller before the interaction
+        is acknowledged.
+        
         Args:
             interaction: Discord interaction object
             
@@ -521,27 +681,6 @@ class FavoriteButton(Button):
             True if successful
         """
         try:
-            # Check if user is in voice channel (handle both Member and User types)
-            user_voice = getattr(interaction.user, 'voice', None)
-            if not user_voice or not user_voice.channel:
-                if interaction.followup:
-                    await interaction.followup.send(
-                        "😢 You are not in a voice channel. Where am I supposed to go?",
-                        ephemeral=True
-                    )
-                return False
-            
-            # Check if bot is already playing
-            if interaction.guild:
-                voice_client = interaction.guild.voice_client
-                if voice_client and hasattr(voice_client, 'is_playing') and voice_client.is_playing():
-                    if interaction.followup:
-                        await interaction.followup.send(
-                            "😱 I'm already playing music! I can't be in two places at once",
-                            ephemeral=True
-                        )
-                    return False
-            
             # Use StreamService instead of direct bot import
             if self.stream_service:
                 try:
@@ -553,8 +692,10 @@ class FavoriteButton(Button):
             else:
                 # Fallback: try to access StreamService differently
                 try:
-                    from services.stream_service import StreamService
-                    stream_service = self.service_registry.get(StreamService)
+                    stream_service_class = _get_stream_service_class()
+                    if stream_service_class is None:
+                        raise RuntimeError("StreamService could not be imported")
+                    stream_service = self.service_registry.get(stream_service_class)
                     await stream_service.start_stream(interaction, self.stream_url)
                     return True
                 except Exception as fallback_error:
@@ -571,15 +712,6 @@ class FavoriteButton(Button):
         except Exception as e:
             logger.error(f"Error playing favorite {self.favorite_number}: {e}")
             return False
-    
-    async def _reset_state_after_delay(self, delay: float) -> None:
-        """Reset favorite button state after delay"""
-        try:
-            await asyncio.sleep(delay)
-            if self.state in [ComponentState.SUCCESS, ComponentState.ERROR]:
-                await self.update_state(ComponentState.NORMAL)
-        except Exception as e:
-            logger.error(f"Error resetting favorite button state: {e}")
 
 # Helper view for confirmation dialogs
 class ConfirmationView(discord.ui.View):
@@ -588,15 +720,36 @@ class ConfirmationView(discord.ui.View):
     def __init__(self):
         super().__init__(timeout=60)
         self.confirmed = False
+        self._decided = asyncio.Event()
+    
+    async def wait_for_decision(self) -> bool:
+        """
+        Wait until the user confirms, cancels or the view times out.
+        
+        Returns:
+            True if user confirmed, False otherwise
+        """
+        try:
+            await asyncio.wait_for(self._decided.wait(), timeout=self.timeout)
+        except asyncio.TimeoutError:
+            return False
+        return self.confirmed
+    
+    def _decide(self, confirmed: bool) -> None:
+        """Record the user's decision and release the waiting caller"""
+        self.confirmed = confirmed
+        self._decided.set()
+        self.stop()
+    
+    async def on_timeout(self) -> None:
+        self._decided.set()
     
     @discord.ui.button(label="✅ Confirm", style=discord.ButtonStyle.success)
     async def confirm_button(self, interaction: discord.Interaction, button: discord.ui.Button):
-        self.confirmed = True
-        self.stop()
+        self._decide(True)
         await interaction.response.edit_message(content="✅ Confirmed", view=None)
     
     @discord.ui.button(label="❌ Cancel", style=discord.ButtonStyle.secondary)
     async def cancel_button(self, interaction: discord.Interaction, button: discord.ui.Button):
-        self.confirmed = False
-        self.stop()
+        self._decide(False)
         await interaction.response.edit_message(content="❌ Cancelled", view=None)
@@ -20,9 +20,32 @@ class Modal(discord.ui.Modal):
     def __init__(self, title: str, custom_id: str, theme: ComponentTheme):
         super().__init__(title=title, custom_id=custom_id)
         self.theme = theme
+        self._inputs: List[discord.ui.TextInput] = [
+            item for item in self.children if isinstance(item, discord.ui.TextInput)
+        ]
         self.result: Dict[str, Any] = {}
         self.callback_func: Optional[Callable] = None
     
+    def add_item(self, item: discord.ui.Item) -> 'Modal':
+        """Add item to the modal, tracking text inputs for submission"""
+        super().add_item(item)
+        if isinstance(item, discord.ui.TextInput):
+            self._inputs.append(item)
+        return self
+    
+    def remove_item(self, item: discord.ui.Item) -> 'Modal':
+        """Remove item from the modal and stop tracking it"""
+        super().remove_item(item)
+        if item in self._inputs:
+            self._inputs.remove(item)
+        return self
+    
+    def clear_items(self) -> 'Modal':
+        """Remove all items from the modal"""
+        super().clear_items()
+        self._inputs.clear()
+        return self
+    
     def set_callback(self, callback: Callable) -> None:
         """Set callback function for modal completion"""
         self.callback_func = callback
@@ -31,9 +54,8 @@ class Modal(discord.ui.Modal):
         """Handle modal submission"""
         try:
             # Extract values from modal
-            for item in self.children:
-                if hasattr(item, 'value'):
-                    self.result[item.custom_id] = item.value
+            for item in self._inputs:
+                self.result[item.custom_id] = item.value
             
             if self.callback_func:
                 await self.callback_func(interaction, self.result)
@@ -9,6 +9,10 @@ from ..interfaces import ComponentTheme, ComponentState
 
 logger = logging.getLogger('discord.ui.components.progress_bar')
 
+# Every possible bar rendering, indexed by number of filled blocks
+_BAR_WIDTH = 20
+_BARS = tuple("█" * i + "░" * (_BAR_WIDTH - i) for i in range(_BAR_WIDTH + 1))
+
 class ProgressBar(BaseComponent):
     """Progress bar component for visual feedback"""
     
@@ -19,14 +23,12 @@ class ProgressBar(BaseComponent):
     
     async def render(self, **kwargs):
         """Render progress bar as text representation"""
-        progress = min(self.current_value / self.max_value, 1.0)
-        filled_blocks = int(progress * 20)
-        empty_blocks = 20 - filled_blocks
-        
-        bar = "█" * filled_blocks + "░" * empty_blocks
-        percentage = int(progress * 100)
+        if self.max_value <= 0:
+            progress = 0.0
+        else:
+            progress = max(0.0, min(self.current_value / self.max_value, 1.0))
         
-        return f"{bar} {percentage}%"
+        return f"{_BARS[int(progress * _BAR_WIDTH)]} {int(progress * 100)}%"
 
 class VolumeProgressBar(ProgressBar):
     """Progress bar specifically for volume display"""
@@ -11,14 +11,70 @@ Component Types:
 """
 
 import logging
-from typing import List, Dict, Any, Optional, Callable
+import functools
+from typing import List, Dict, Any, Optional, Callable, Tuple
 import discord
 
 from .base_component import BaseComponent
-from ..interfaces import ComponentTheme, ComponentState, UI_CONSTANTS
+from ..interfaces import (
+    ComponentTheme, ComponentState, MAX_SELECT_OPTIONS, MAX_SELECT_OPTION_DESCRIPTION_LENGTH
+)
 
 logger = logging.getLogger('discord.ui.components.select_menu')
 
+# Raw preset metadata per preset type
+_PRESETS: Dict[str, Tuple[Dict[str, str], ...]] = {
+    "eq": (
+        {"name": "Flat", "value": "flat", "emoji": "⚪"},
+        {"name": "Rock", "value": "rock", "emoji": "🎸"},
+        {"name": "Pop", "value": "pop", "emoji": "🎤"},
+        {"name": "Jazz", "value": "jazz", "emoji": "🎷"},
+        {"name": "Classical", "value": "classical", "emoji": "🎼"},
+        {"name": "Electronic", "value": "electronic", "emoji": "🎛️"},
+        {"name": "Vocal", "value": "vocal", "emoji": "🗣️"},
+        {"name": "Bass Boost", "value": "bass_boost", "emoji": "🔊"},
+        {"name": "Treble Boost", "value": "treble_boost", "emoji": "🔆"}
+    )
+}
+
+# Options for the placeholder select returned when rendering fails
+_FALLBACK_OPTIONS = (discord.SelectOption(label="Error", value="error"),)
+
+def _clip_description(description: str) -> str:
+    """Truncate a description to Discord's option limit, slicing only when needed"""
+    if len(description) > MAX_SELECT_OPTION_DESCRIPTION_LENGTH:
+        return description[:MAX_SELECT_OPTION_DESCRIPTION_LENGTH]
+    return description
+
+@functools.lru_cache(maxsize=8)
+def _build_preset_options(preset_type: str) -> Tuple[discord.SelectOption, ...]:
+    """Build the select options for a preset type once"""
+    return tuple([
+        discord.SelectOption(
+            label=preset["name"],
+            value=preset["value"],
+            emoji=preset["emoji"]
+        ) for preset in _PRESETS.get(preset_type, ())
+    ])
+
+@functools.lru_cache(maxsize=128)
+def _build_stream_options(streams_key: Tuple[Tuple[Any, ...], ...]) -> Tuple[discord.SelectOption, ...]:
+    """Build stream select options from (name, url, description, emoji) tuples"""
+    return tuple([
+        discord.SelectOption(label=name, value=url, description=description, emoji=emoji)
+        for name, url, description, emoji in streams_key
+    ])
+
+class _BoundSelect(discord.ui.Select):
+    """Discord select that dispatches its callback to the owning SelectMenu"""
+    
+    def __init__(self, menu: 'SelectMenu', **kwargs):
+        super().__init__(**kwargs)
+        self._menu = menu
+    
+    async def callback(self, interaction: discord.Interaction) -> None:
+        await self._menu._select_callback(interaction)
+
 class SelectMenu(BaseComponent):
     """Enhanced select menu component with theming and categorization"""
     
@@ -26,56 +82,70 @@ class SelectMenu(BaseComponent):
                  options: List[discord.SelectOption], max_values: int = 1):
         super().__init__(component_id, theme)
         self.placeholder = placeholder
-        self.options = options
-        self.max_values = max_values
+        
+        # Bound options and selection count to Discord limits once
+        self.options = options[:MAX_SELECT_OPTIONS]
+        self.max_values = min(max_values, len(self.options)) or 1
         self.selected_values: List[str] = []
         
-        logger.debug(f"Created select menu {component_id} with {len(options)} options")
+        logger.debug("Created select menu %s with %d options", component_id, len(options))
     
     async def render(self, **kwargs) -> discord.ui.Select:
         """Render the select menu as a Discord UI select"""
         try:
-            select = discord.ui.Select(
+            return _BoundSelect(
+                self,
                 placeholder=self.placeholder,
-                options=self.options[:25],  # Discord limit
-                max_values=min(self.max_values, len(self.options)),
+                options=self.options,
+                max_values=self.max_values,
                 disabled=not self.enabled,
                 custom_id=self.component_id
             )
             
-            select.callback = self._select_callback
-            return select
-            
         except Exception as e:
-            logger.error(f"Error rendering select menu {self.component_id}: {e}")
-            # Return fallback select
+            logger.error("Error rendering select menu %s: %s", self.component_id, e)
+            # Return fallback select (a Select attaches to one view, so only options are shared)
             return discord.ui.Select(
                 placeholder="Error",
-                options=[discord.SelectOption(label="Error", value="error")],
+                options=list(_FALLBACK_OPTIONS),
                 disabled=True
             )
     
     async def _select_callback(self, interaction: discord.Interaction) -> None:
         """Handle select menu interaction"""
+        # Acknowledge first so slow handlers cannot outlive the interaction
+        if not interaction.response.is_done():
+            try:
+                await interaction.response.defer()
+            except discord.NotFound:
+                logger.warning("Select interaction for %s expired before it was acknowledged",
+                               self.component_id)
+        
         try:
             self.selected_values = interaction.data.get('values', [])
-            await self.set_value(self.selected_values)
+            self.set_value(self.selected_values)
             await self.handle_interaction(interaction)
         except Exception as e:
-            logger.error(f"Error in select callback for {self.component_id}: {e}")
+            logger.error("Error in select callback for %s: %s", self.component_id, e)
 
 class StreamSelectMenu(SelectMenu):
     """Specialized select menu for stream/station selection"""
     
     def __init__(self, component_id: str, theme: ComponentTheme, streams: List[Dict[str, Any]]):
-        options = []
-        for i, stream in enumerate(streams[:25]):  # Discord limit
-            options.append(discord.SelectOption(
-                label=stream.get('name', f'Stream {i+1}'),
-                value=stream.get('url', ''),
-                description=stream.get('description', '')[:100],  # Discord limit
-                emoji=stream.get('emoji', '🎵')
-            ))
+        streams_key = tuple([
+            (
+                stream.get('name', f'Stream {i+1}'),
+                stream.get('url', ''),
+                _clip_description(stream.get('description') or ''),
+                stream.get('emoji', '🎵')
+            )
+            for i, stream in enumerate(streams[:MAX_SELECT_OPTIONS])  # Discord limit
+        ])
+        try:
+            options = list(_build_stream_options(streams_key))
+        except TypeError:
+            # Unhashable field values cannot key the cache; build directly
+            options = list(_build_stream_options.__wrapped__(streams_key))
         
         super().__init__(component_id, theme, "Select a stream", options)
         self.streams = streams
@@ -84,28 +154,7 @@ class PresetSelectMenu(SelectMenu):
     """Specialized select menu for audio presets"""
     
     def __init__(self, component_id: str, theme: ComponentTheme, preset_type: str = "eq"):
-        if preset_type == "eq":
-            presets = [
-                {"name": "Flat", "value": "flat", "emoji": "⚪"},
-                {"name": "Rock", "value": "rock", "emoji": "🎸"},
-                {"name": "Pop", "value": "pop", "emoji": "🎤"},
-                {"name": "Jazz", "value": "jazz", "emoji": "🎷"},
-                {"name": "Classical", "value": "classical", "emoji": "🎼"},
-                {"name": "Electronic", "value": "electronic", "emoji": "🎛️"},
-                {"name": "Vocal", "value": "vocal", "emoji": "🗣️"},
-                {"name": "Bass Boost", "value": "bass_boost", "emoji": "🔊"},
-                {"name": "Treble Boost", "value": "treble_boost", "emoji": "🔆"}
-            ]
-        else:
-            presets = []
-        
-        options = [
-            discord.SelectOption(
-                label=preset["name"],
-                value=preset["value"],
-                emoji=preset["emoji"]
-            ) for preset in presets
-        ]
+        options = list(_build_preset_options(preset_type))
         
         super().__init__(component_id, theme, f"Select {preset_type} preset", options)
         self.preset_type = preset_type
@@ -4,10 +4,18 @@ Status Indicator Components for BunBot Enhanced UI System
 
 import logging
 from .base_component import BaseComponent
-from ..interfaces import ComponentTheme, ComponentState
+from ..interfaces import ComponentTheme
 
 logger = logging.getLogger('discord.ui.components.status_indicator')
 
+# Fully rendered output for each known status
+_STATUS_RENDERED = {
+    "normal": "🟢 Normal",
+    "warning": "🟡 Warning",
+    "error": "🔴 Error",
+    "loading": "🔄 Loading"
+}
+
 class StatusIndicator(BaseComponent):
     """Status indicator component"""
     
@@ -16,13 +24,10 @@ class StatusIndicator(BaseComponent):
         self.status = "normal"
     
     async def render(self, **kwargs):
-        emoji_map = {
-            "normal": "🟢",
-            "warning": "🟡", 
-            "error": "🔴",
-            "loading": "🔄"
-        }
-        return f"{emoji_map.get(self.status, '⚪')} {self.status.title()}"
+        rendered = _STATUS_RENDERED.get(self.status)
+        if rendered is None:
+            rendered = f"⚪ {self.status.title()}"
+        return rendered
 
 class ConnectionStatus(StatusIndicator):
     """Connection status indicator"""
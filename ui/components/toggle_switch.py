@@ -4,10 +4,13 @@ Toggle Switch Components for BunBot Enhanced UI System
 
 import logging
 from .base_component import BaseComponent
-from ..interfaces import ComponentTheme, ComponentState
+from ..interfaces import ComponentTheme
 
 logger = logging.getLogger('discord.ui.components.toggle_switch')
 
+_RENDERED_ON = "✅ On"
+_RENDERED_OFF = "❌ Off"
+
 class ToggleSwitch(BaseComponent):
     """Toggle switch component"""
     
@@ -16,8 +19,7 @@ class ToggleSwitch(BaseComponent):
         self.toggled = False
     
     async def render(self, **kwargs):
-        emoji = "✅" if self.toggled else "❌"
-        return f"{emoji} {'On' if self.toggled else 'Off'}"
+        return _RENDERED_ON if self.toggled else _RENDERED_OFF
 
 class EffectToggle(ToggleSwitch):
     """Toggle switch for audio effects"""
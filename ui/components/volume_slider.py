@@ -4,7 +4,7 @@ Volume Slider Components for BunBot Enhanced UI System
 
 import logging
 from .base_component import BaseComponent
-from ..interfaces import ComponentTheme, ComponentState
+from ..interfaces import ComponentTheme
 
 logger = logging.getLogger('discord.ui.components.volume_slider')
 
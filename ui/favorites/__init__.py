@@ -2,25 +2,17 @@
 Favorites UI Components for BunBot
 """
 
-# Simple stub classes for missing favorites UI components
-class FavoritesManager:
-    """Favorites manager UI component"""
-    pass
+# Simple stub classes for missing favorites UI components, generated as slotted types
+_STUBS = {
+    'FavoritesManager': "Favorites manager UI component",
+    'QuickAccess': "Quick access UI component",
+    'CategoryOrganizer': "Category organizer UI component",
+    'FavoriteButton': "Favorite button UI component",
+    'PlaylistView': "Playlist view UI component"
+}
 
-class QuickAccess:
-    """Quick access UI component"""
-    pass
-
-class CategoryOrganizer:
-    """Category organizer UI component"""
-    pass
-
-class FavoriteButton:
-    """Favorite button UI component"""
-    pass
-
-class PlaylistView:
-    """Playlist view UI component"""
-    pass
+for _name, _doc in _STUBS.items():
+    globals()[_name] = type(_name, (), {'__slots__': (), '__doc__': _doc, '__module__': __name__})
+del _name, _doc
 
 __all__ = ['FavoritesManager', 'QuickAccess', 'CategoryOrganizer', 'FavoriteButton', 'PlaylistView']
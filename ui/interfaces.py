@@ -13,11 +13,13 @@ Key Abstractions:
 """
 
 import logging
+import re
 from abc import ABC, abstractmethod
+from types import MappingProxyType
 from typing import Dict, Any, List, Optional, Union, Callable, Tuple
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, asdict, replace
 from enum import Enum
-from datetime import datetime, timezone
+from datetime import datetime
 import discord
 
 logger = logging.getLogger('discord.ui.interfaces')
@@ -55,7 +57,7 @@ class UIEvent(Enum):
     THEME_CHANGED = "theme_changed"
     DEVICE_CHANGED = "device_changed"
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ColorScheme:
     """Color scheme for UI theming"""
     primary: str = "#5865F2"          # Discord blurple
@@ -69,7 +71,7 @@ class ColorScheme:
     text_secondary: str = "#B9BBBE"   # Secondary text
     accent: str = "#00D4AA"           # Custom accent color
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class FontSettings:
     """Font settings for UI components"""
     family: str = "Whitney, 'Helvetica Neue', Helvetica, Arial, sans-serif"
@@ -80,11 +82,15 @@ class FontSettings:
     weight_normal: str = "400"
     weight_bold: str = "600"
 
-@dataclass
+# Shared immutable defaults; themes reference these until colors/fonts are overridden
+_DEFAULT_COLORS = ColorScheme()
+_DEFAULT_FONTS = FontSettings()
+
+@dataclass(frozen=True, slots=True)
 class ComponentTheme:
     """Theme settings for UI components"""
-    colors: ColorScheme = field(default_factory=ColorScheme)
-    fonts: FontSettings = field(default_factory=FontSettings)
+    colors: ColorScheme = field(default=_DEFAULT_COLORS)
+    fonts: FontSettings = field(default=_DEFAULT_FONTS)
     border_radius: int = 4
     spacing_small: int = 4
     spacing_normal: int = 8
@@ -92,39 +98,15 @@ class ComponentTheme:
     shadow_enabled: bool = True
     animations_enabled: bool = True
     
+    def with_colors(self, colors: ColorScheme) -> 'ComponentTheme':
+        """Return a copy of this theme using the given color scheme"""
+        return replace(self, colors=colors)
+    
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for serialization"""
-        return {
-            'colors': {
-                'primary': self.colors.primary,
-                'secondary': self.colors.secondary,
-                'success': self.colors.success,
-                'warning': self.colors.warning,
-                'error': self.colors.error,
-                'background': self.colors.background,
-                'surface': self.colors.surface,
-                'text_primary': self.colors.text_primary,
-                'text_secondary': self.colors.text_secondary,
-                'accent': self.colors.accent
-            },
-            'fonts': {
-                'family': self.fonts.family,
-                'size_small': self.fonts.size_small,
-                'size_normal': self.fonts.size_normal,
-                'size_large': self.fonts.size_large,
-                'size_title': self.fonts.size_title,
-                'weight_normal': self.fonts.weight_normal,
-                'weight_bold': self.fonts.weight_bold
-            },
-            'border_radius': self.border_radius,
-            'spacing_small': self.spacing_small,
-            'spacing_normal': self.spacing_normal,
-            'spacing_large': self.spacing_large,
-            'shadow_enabled': self.shadow_enabled,
-            'animations_enabled': self.animations_enabled
-        }
-
-@dataclass
+        return asdict(self, dict_factory=_serialization_factory)
+
+@dataclass(frozen=True, slots=True)
 class AccessibilityFeatures:
     """Accessibility features configuration"""
     high_contrast: bool = False
@@ -137,17 +119,9 @@ class AccessibilityFeatures:
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for serialization"""
-        return {
-            'high_contrast': self.high_contrast,
-            'large_text': self.large_text,
-            'reduced_motion': self.reduced_motion,
-            'screen_reader_support': self.screen_reader_support,
-            'keyboard_navigation': self.keyboard_navigation,
-            'focus_indicators': self.focus_indicators,
-            'alt_text_enabled': self.alt_text_enabled
-        }
-
-@dataclass
+        return asdict(self, dict_factory=_serialization_factory)
+
+@dataclass(frozen=True, slots=True)
 class UIConfig:
     """UI configuration for a guild"""
     # Theme settings
@@ -184,30 +158,56 @@ class UIConfig:
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for serialization"""
-        return {
-            'theme_name': self.theme_name,
-            'custom_theme': self.custom_theme.to_dict() if self.custom_theme else None,
-            'default_layout': self.default_layout.value,
-            'mobile_layout': self.mobile_layout.value,
-            'auto_detect_device': self.auto_detect_device,
-            'auto_refresh_interval': self.auto_refresh_interval,
-            'animation_duration': self.animation_duration,
-            'tooltip_delay': self.tooltip_delay,
-            'accessibility': self.accessibility.to_dict(),
-            'show_realtime_controls': self.show_realtime_controls,
-            'show_eq_controls': self.show_eq_controls,
-            'show_mixer_controls': self.show_mixer_controls,
-            'favorites_per_page': self.favorites_per_page,
-            'show_categories': self.show_categories,
-            'quick_access_count': self.quick_access_count,
-            'touch_friendly_buttons': self.touch_friendly_buttons,
-            'swipe_gestures_enabled': self.swipe_gestures_enabled,
-            'haptic_feedback': self.haptic_feedback
-        }
+        return asdict(self, dict_factory=_serialization_factory)
+
+def _serialization_factory(items: List[Tuple[str, Any]]) -> Dict[str, Any]:
+    """asdict() factory producing plain dicts with enums as their values"""
+    return {
+        key: value.value if isinstance(value, Enum) else value
+        for key, value in items
+    }
+
+@dataclass(slots=True)
+class StateChangeEvent:
+    """Payload emitted when a component's visual state changes"""
+    component_id: str
+    old_state: str
+    new_state: str
+    timestamp: datetime
+
+@dataclass(slots=True)
+class EnabledChangeEvent:
+    """Payload emitted when enabling/disabling a component changes its state"""
+    component_id: str
+    old_enabled: bool
+    new_enabled: bool
+    old_state: str
+    new_state: str
+    timestamp: datetime
+
+@dataclass(slots=True)
+class ValueChangeEvent:
+    """Payload emitted when a component's value changes"""
+    component_id: str
+    old_value: Any
+    new_value: Any
+    timestamp: datetime
+
+@dataclass(slots=True)
+class InteractionEvent:
+    """Payload emitted when a user interacts with a component"""
+    component_id: str
+    user_id: int
+    guild_id: Optional[int]
+    timestamp: datetime
+
+UIEventData = Union[StateChangeEvent, EnabledChangeEvent, ValueChangeEvent, InteractionEvent]
 
 class IUIComponent(ABC):
     """Abstract interface for UI components"""
     
+    __slots__ = ()
+    
     @abstractmethod
     def __init__(self, component_id: str, theme: ComponentTheme):
         """Initialize component with ID and theme"""
@@ -219,22 +219,22 @@ class IUIComponent(ABC):
         pass
     
     @abstractmethod
-    async def update_state(self, state: ComponentState) -> None:
+    def update_state(self, state: ComponentState) -> None:
         """Update component visual state"""
         pass
     
     @abstractmethod
-    async def set_enabled(self, enabled: bool) -> None:
+    def set_enabled(self, enabled: bool) -> None:
         """Enable or disable the component"""
         pass
     
     @abstractmethod
-    async def get_value(self) -> Any:
+    def get_value(self) -> Any:
         """Get current component value"""
         pass
     
     @abstractmethod
-    async def set_value(self, value: Any) -> None:
+    def set_value(self, value: Any) -> None:
         """Set component value"""
         pass
 
@@ -275,18 +275,18 @@ class ILayout(ABC):
     """Abstract interface for layout managers"""
     
     @abstractmethod
-    async def arrange_components(self, components: List[IUIComponent], 
+    def arrange_components(self, components: List[IUIComponent], 
                                device_type: DeviceType) -> List[List[IUIComponent]]:
         """Arrange components for the given device type"""
         pass
     
     @abstractmethod
-    async def get_max_components_per_row(self, device_type: DeviceType) -> int:
+    def get_max_components_per_row(self, device_type: DeviceType) -> int:
         """Get maximum components per row for device type"""
         pass
     
     @abstractmethod
-    async def should_use_compact_layout(self, device_type: DeviceType) -> bool:
+    def should_use_compact_layout(self, device_type: DeviceType) -> bool:
         """Determine if compact layout should be used"""
         pass
 
@@ -376,57 +376,72 @@ class IStreamSelector(ABC):
         pass
 
 # Event handling types
-UIEventHandler = Callable[[UIEvent, Dict[str, Any]], None]
+UIEventHandler = Callable[[UIEvent, UIEventData], None]
 ComponentInteractionHandler = Callable[[discord.Interaction, IUIComponent], None]
 ViewInteractionHandler = Callable[[discord.Interaction, IView], None]
 
 # Device detection utilities
+_MOBILE_UA_RE = re.compile(r'mobile|android|iphone|ipod', re.IGNORECASE)
+_TABLET_UA_RE = re.compile(r'tablet|ipad', re.IGNORECASE)
+
 def detect_device_type(user_agent: Optional[str] = None) -> DeviceType:
     """Detect device type from user agent or other indicators"""
     if not user_agent:
         return DeviceType.UNKNOWN
     
-    user_agent_lower = user_agent.lower()
-    
-    if any(mobile in user_agent_lower for mobile in ['mobile', 'android', 'iphone', 'ipod']):
+    if _MOBILE_UA_RE.search(user_agent):
         return DeviceType.MOBILE
-    elif any(tablet in user_agent_lower for tablet in ['tablet', 'ipad']):
+    elif _TABLET_UA_RE.search(user_agent):
         return DeviceType.TABLET
     else:
         return DeviceType.DESKTOP
 
+_OPTIMAL_LAYOUT: Dict[DeviceType, LayoutMode] = {
+    DeviceType.MOBILE: LayoutMode.COMPACT,
+    DeviceType.TABLET: LayoutMode.NORMAL,
+    DeviceType.DESKTOP: LayoutMode.EXPANDED,
+    DeviceType.UNKNOWN: LayoutMode.NORMAL
+}
+
 def get_optimal_layout(device_type: DeviceType, user_preference: Optional[LayoutMode] = None) -> LayoutMode:
     """Get optimal layout mode for device type and user preference"""
-    if user_preference:
-        return user_preference
-    
-    if device_type == DeviceType.MOBILE:
-        return LayoutMode.COMPACT
-    elif device_type == DeviceType.TABLET:
-        return LayoutMode.NORMAL
-    elif device_type == DeviceType.DESKTOP:
-        return LayoutMode.EXPANDED
-    else:
-        return LayoutMode.NORMAL
+    return user_preference or _OPTIMAL_LAYOUT.get(device_type, LayoutMode.NORMAL)
 
 # UI Constants
-UI_CONSTANTS = {
-    'MAX_EMBED_FIELDS': 25,
-    'MAX_EMBED_FIELD_LENGTH': 1024,
-    'MAX_EMBED_DESCRIPTION_LENGTH': 4096,
-    'MAX_BUTTON_LABEL_LENGTH': 80,
-    'MAX_SELECT_OPTION_LABEL_LENGTH': 100,
-    'MAX_COMPONENTS_PER_ROW': 5,
-    'MAX_ROWS_PER_VIEW': 5,
-    'INTERACTION_TIMEOUT': 900,  # 15 minutes
-    'AUTO_REFRESH_INTERVAL': 30,  # 30 seconds
-    'ANIMATION_DURATION_SHORT': 0.15,  # 150ms
-    'ANIMATION_DURATION_NORMAL': 0.3,  # 300ms
-    'ANIMATION_DURATION_LONG': 0.5,   # 500ms
-}
+MAX_EMBED_FIELDS = 25
+MAX_EMBED_FIELD_LENGTH = 1024
+MAX_EMBED_DESCRIPTION_LENGTH = 4096
+MAX_BUTTON_LABEL_LENGTH = 80
+MAX_SELECT_OPTION_LABEL_LENGTH = 100
+MAX_SELECT_OPTION_DESCRIPTION_LENGTH = 100
+MAX_SELECT_OPTIONS = 25
+MAX_COMPONENTS_PER_ROW = 5
+MAX_ROWS_PER_VIEW = 5
+INTERACTION_TIMEOUT = 900  # 15 minutes
+AUTO_REFRESH_INTERVAL = 30  # 30 seconds
+ANIMATION_DURATION_SHORT = 0.15  # 150ms
+ANIMATION_DURATION_NORMAL = 0.3  # 300ms
+ANIMATION_DURATION_LONG = 0.5   # 500ms
+
+UI_CONSTANTS = MappingProxyType({
+    'MAX_EMBED_FIELDS': MAX_EMBED_FIELDS,
+    'MAX_EMBED_FIELD_LENGTH': MAX_EMBED_FIELD_LENGTH,
+    'MAX_EMBED_DESCRIPTION_LENGTH': MAX_EMBED_DESCRIPTION_LENGTH,
+    'MAX_BUTTON_LABEL_LENGTH': MAX_BUTTON_LABEL_LENGTH,
+    'MAX_SELECT_OPTION_LABEL_LENGTH': MAX_SELECT_OPTION_LABEL_LENGTH,
+    'MAX_SELECT_OPTION_DESCRIPTION_LENGTH': MAX_SELECT_OPTION_DESCRIPTION_LENGTH,
+    'MAX_SELECT_OPTIONS': MAX_SELECT_OPTIONS,
+    'MAX_COMPONENTS_PER_ROW': MAX_COMPONENTS_PER_ROW,
+    'MAX_ROWS_PER_VIEW': MAX_ROWS_PER_VIEW,
+    'INTERACTION_TIMEOUT': INTERACTION_TIMEOUT,
+    'AUTO_REFRESH_INTERVAL': AUTO_REFRESH_INTERVAL,
+    'ANIMATION_DURATION_SHORT': ANIMATION_DURATION_SHORT,
+    'ANIMATION_DURATION_NORMAL': ANIMATION_DURATION_NORMAL,
+    'ANIMATION_DURATION_LONG': ANIMATION_DURATION_LONG
+})
 
 # UI Event Constants
-UI_EVENTS = {
+UI_EVENTS = MappingProxyType({
     'component_clicked': 'ui_component_clicked',
     'component_changed': 'ui_component_changed',
     'view_opened': 'ui_view_opened',
@@ -435,4 +450,4 @@ UI_EVENTS = {
     'theme_changed': 'ui_theme_changed',
     'device_changed': 'ui_device_changed',
     'accessibility_changed': 'ui_accessibility_changed'
-}
+})
@@ -1,23 +1,13 @@
 """
 Layout System for BunBot UI
-"""
 
-from .responsive_layout import ResponsiveLayout
+Layout variants are created through ResponsiveLayout factory classmethods
+(e.g. ResponsiveLayout.mobile(), ResponsiveLayout.desktop()).
+"""
 
-# Create aliases for all layout types
-MobileLayout = ResponsiveLayout
-DesktopLayout = ResponsiveLayout
-CompactLayout = ResponsiveLayout
-ExpandedLayout = ResponsiveLayout
-TabletLayout = ResponsiveLayout
-GridLayout = ResponsiveLayout
+from .responsive_layout import ResponsiveLayout, DEFAULT_LAYOUT
 
 __all__ = [
     'ResponsiveLayout', 
-    'MobileLayout', 
-    'DesktopLayout', 
-    'CompactLayout',
-    'ExpandedLayout',
-    'TabletLayout',
-    'GridLayout'
+    'DEFAULT_LAYOUT'
 ]
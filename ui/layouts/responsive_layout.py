@@ -5,9 +5,45 @@ Responsive Layout System for BunBot UI
 class ResponsiveLayout:
     """Simple responsive layout manager for Discord UI components"""
     
-    def __init__(self):
-        pass
+    __slots__ = ('screen_size',)
     
-    def create_layout(self, components, screen_size="default"):
+    def __init__(self, screen_size: str = "default"):
+        self.screen_size = screen_size
+    
+    @classmethod
+    def mobile(cls) -> "ResponsiveLayout":
+        """Create a layout configured for mobile screens"""
+        return cls("mobile")
+    
+    @classmethod
+    def tablet(cls) -> "ResponsiveLayout":
+        """Create a layout configured for tablet screens"""
+        return cls("tablet")
+    
+    @classmethod
+    def desktop(cls) -> "ResponsiveLayout":
+        """Create a layout configured for desktop screens"""
+        return cls("desktop")
+    
+    @classmethod
+    def compact(cls) -> "ResponsiveLayout":
+        """Create a compact layout"""
+        return cls("compact")
+    
+    @classmethod
+    def expanded(cls) -> "ResponsiveLayout":
+        """Create an expanded layout"""
+        return cls("expanded")
+    
+    @classmethod
+    def grid(cls) -> "ResponsiveLayout":
+        """Create a grid layout"""
+        return cls("grid")
+    
+    @staticmethod
+    def create_layout(components, screen_size="default"):
         """Create a responsive layout for the given components"""
         return components  # Simple passthrough for now
+
+# Shared stateless instance so callers need not instantiate a layout
+DEFAULT_LAYOUT = ResponsiveLayout()
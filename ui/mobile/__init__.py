@@ -2,25 +2,17 @@
 Mobile UI Components for BunBot
 """
 
-# Simple stub classes for missing mobile UI components
-class MobileLayout:
-    """Mobile layout UI component"""
-    pass
+# Simple stub classes for missing mobile UI components, generated as slotted types
+_STUBS = {
+    'MobileLayout': "Mobile layout UI component",
+    'TouchControls': "Touch controls UI component",
+    'CompactViews': "Compact views UI component",
+    'SwipeGestures': "Swipe gestures UI component",
+    'MobileNavigation': "Mobile navigation UI component"
+}
 
-class TouchControls:
-    """Touch controls UI component"""
-    pass
-
-class CompactViews:
-    """Compact views UI component"""
-    pass
-
-class SwipeGestures:
-    """Swipe gestures UI component"""
-    pass
-
-class MobileNavigation:
-    """Mobile navigation UI component"""
-    pass
+for _name, _doc in _STUBS.items():
+    globals()[_name] = type(_name, (), {'__slots__': (), '__doc__': _doc, '__module__': __name__})
+del _name, _doc
 
 __all__ = ['MobileLayout', 'TouchControls', 'CompactViews', 'SwipeGestures', 'MobileNavigation']
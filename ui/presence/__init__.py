@@ -2,25 +2,17 @@
 Rich Presence UI Components for BunBot
 """
 
-# Simple stub classes for missing presence UI components
-class PresenceManager:
-    """Presence manager UI component"""
-    pass
+# Simple stub classes for missing presence UI components, generated as slotted types
+_STUBS = {
+    'PresenceManager': "Presence manager UI component",
+    'ActivityManager': "Activity manager UI component",
+    'NowPlayingDisplay': "Now playing display UI component",
+    'StreamInfoDisplay': "Stream info display UI component",
+    'StatusBroadcaster': "Status broadcaster UI component"
+}
 
-class ActivityManager:
-    """Activity manager UI component"""
-    pass
-
-class NowPlayingDisplay:
-    """Now playing display UI component"""
-    pass
-
-class StreamInfoDisplay:
-    """Stream info display UI component"""
-    pass
-
-class StatusBroadcaster:
-    """Status broadcaster UI component"""
-    pass
+for _name, _doc in _STUBS.items():
+    globals()[_name] = type(_name, (), {'__slots__': (), '__doc__': _doc, '__module__': __name__})
+del _name, _doc
 
 __all__ = ['PresenceManager', 'ActivityManager', 'NowPlayingDisplay', 'StreamInfoDisplay', 'StatusBroadcaster']
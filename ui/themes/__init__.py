@@ -1,23 +1,10 @@
 """
 Theme System for BunBot UI
+
+Theme variants are created through ThemeManager factory classmethods
+(e.g. ThemeManager.dark(), ThemeManager.high_contrast()).
 """
 
 from .theme_manager import ThemeManager
 
-# Aliases for UI theme-related classes
-DefaultTheme = ThemeManager
-DarkTheme = ThemeManager
-LightTheme = ThemeManager
-HighContrastTheme = ThemeManager
-ColorScheme = ThemeManager
-FontSettings = ThemeManager
-IconTheme = ThemeManager
-AnimationSettings = ThemeManager
-LayoutTheme = ThemeManager
-CustomTheme = ThemeManager
-
-__all__ = [
-    'ThemeManager', 'DefaultTheme', 'DarkTheme', 'LightTheme', 
-    'HighContrastTheme', 'ColorScheme', 'FontSettings', 'IconTheme',
-    'AnimationSettings', 'LayoutTheme', 'CustomTheme'
-]
+__all__ = ['ThemeManager']
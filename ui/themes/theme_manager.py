@@ -15,18 +15,73 @@ class ThemeManager:
                 'error_color': discord.Color.red(),
                 'warning_color': discord.Color.orange(),
                 'info_color': discord.Color.blurple()
+            },
+            'dark': {
+                'primary_color': discord.Color.dark_blue(),
+                'success_color': discord.Color.dark_green(),
+                'error_color': discord.Color.dark_red(),
+                'warning_color': discord.Color.dark_orange(),
+                'info_color': discord.Color.dark_theme()
+            },
+            'light': {
+                'primary_color': discord.Color.from_rgb(88, 166, 255),
+                'success_color': discord.Color.from_rgb(87, 242, 135),
+                'error_color': discord.Color.from_rgb(255, 107, 107),
+                'warning_color': discord.Color.from_rgb(255, 200, 87),
+                'info_color': discord.Color.og_blurple()
+            },
+            'high_contrast': {
+                'primary_color': discord.Color.from_rgb(255, 255, 255),
+                'success_color': discord.Color.from_rgb(0, 255, 0),
+                'error_color': discord.Color.from_rgb(255, 0, 0),
+                'warning_color': discord.Color.from_rgb(255, 255, 0),
+                'info_color': discord.Color.from_rgb(0, 255, 255)
             }
         }
         self.current_theme = 'default'
+        self._active_colors = self._resolve_colors(self.current_theme)
+    
+    @classmethod
+    def _with_theme(cls, theme_name: str) -> "ThemeManager":
+        """Create a manager with the given theme already active"""
+        manager = cls()
+        manager.set_theme(theme_name)
+        return manager
+    
+    @classmethod
+    def default(cls) -> "ThemeManager":
+        """Create a manager using the default theme"""
+        return cls()
+    
+    @classmethod
+    def dark(cls) -> "ThemeManager":
+        """Create a manager using the dark theme"""
+        return cls._with_theme('dark')
+    
+    @classmethod
+    def light(cls) -> "ThemeManager":
+        """Create a manager using the light theme"""
+        return cls._with_theme('light')
+    
+    @classmethod
+    def high_contrast(cls) -> "ThemeManager":
+        """Create a manager using the high contrast theme"""
+        return cls._with_theme('high_contrast')
+    
+    def _resolve_colors(self, theme_name: str) -> dict:
+        """Map color types to colors for a theme, keyed without the '_color' suffix"""
+        theme = self.themes.get(theme_name, self.themes['default'])
+        return {key[:-len('_color')]: color for key, color in theme.items() if key.endswith('_color')}
     
     def get_color(self, color_type: str) -> discord.Color:
         """Get a color from the current theme"""
-        theme = self.themes.get(self.current_theme, self.themes['default'])
-        return theme.get(f'{color_type}_color', discord.Color.default())
+        color = self._active_colors.get(color_type)
+        return color if color is not None else discord.Color.default()
     
     def set_theme(self, theme_name: str) -> bool:
         """Set the current theme"""
         if theme_name in self.themes:
             self.current_theme = theme_name
+            self._active_colors = self._resolve_colors(theme_name)
             return True
         return False
@@ -6,20 +6,274 @@ Provides intuitive interface for volume, EQ, and audio metrics.
 """
 
 import logging
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Set, Mapping, Deque
+from collections import deque
+from types import MappingProxyType
 import asyncio
+import time
+import weakref
 from datetime import datetime
 
 import discord
 from discord.ext import commands
 
 from core import ServiceRegistry
-from ui.views.base_view import BaseView
+from ui.views.base_view import BaseView, deferred_callback
+from ui.interfaces import AUTO_REFRESH_INTERVAL
 from audio import IVolumeManager, IEffectsChain, IAudioProcessor
 
 logger = logging.getLogger('ui.views.audio_control')
 
 
+class _RateLimitedLogger:
+    """
+    Logs errors while dropping bursts of the same failure.
+    
+    Errors are keyed by a call-site key and the exception type. Each key may
+    log ``max_per_window`` times within ``window`` seconds; further repeats are
+    counted and reported with the next error that gets through.
+    """
+    
+    __slots__ = ('_logger', '_max_per_window', '_window', '_recent', '_suppressed')
+    
+    def __init__(self, target: logging.Logger, max_per_window: int = 5, window: float = 60.0):
+        self._logger = target
+        self._max_per_window = max_per_window
+        self._window = window
+        self._recent: Dict[tuple, Deque[float]] = {}
+        self._suppressed: Dict[tuple, int] = {}
+    
+    def error_throttled(self, key: str, msg: str, *args: Any) -> None:
+        """Log ``msg % args`` at ERROR unless this key/exception has hit its budget"""
+        exc = args[-1] if args else None
+        bucket = (key, type(exc))
+        now = time.monotonic()
+        
+        recent = self._recent.get(bucket)
+        if recent is None:
+            recent = self._recent[bucket] = deque(maxlen=self._max_per_window)
+        elif len(recent) == self._max_per_window and now - recent[0] < self._window:
+            self._suppressed[bucket] = self._suppressed.get(bucket, 0) + 1
+            return
+        recent.append(now)
+        
+        suppressed = self._suppressed.pop(bucket, 0)
+        if suppressed:
+            self._logger.error(msg + " (%d similar errors suppressed)", *args, suppressed)
+        else:
+            self._logger.error(msg, *args)
+
+
+_error_log = _RateLimitedLogger(logger)
+
+# Prebuilt dashboard bars indexed by filled segment count for the default lengths
+_PROGRESS_BAR_LENGTH = 20
+_PROGRESS_BARS = tuple(
+    f"`{'█' * i}{'░' * (_PROGRESS_BAR_LENGTH - i)}`" for i in range(_PROGRESS_BAR_LENGTH + 1)
+)
+
+_EQ_BAR_LENGTH = 10
+_EQ_BAR_CENTER = _EQ_BAR_LENGTH // 2
+_EQ_BARS_POS = tuple(
+    f"`{'░' * _EQ_BAR_CENTER}{'█' * i}{'░' * (_EQ_BAR_CENTER - i)}`" for i in range(_EQ_BAR_CENTER + 1)
+)
+_EQ_BARS_NEG = tuple(
+    f"`{'░' * (_EQ_BAR_CENTER - i)}{'█' * i}{'░' * _EQ_BAR_CENTER}`" for i in range(_EQ_BAR_CENTER + 1)
+)
+
+_LEVEL_BAR_LENGTH = 15
+_LEVEL_BARS = {
+    bar_char: tuple(bar_char * i + "⬜" * (_LEVEL_BAR_LENGTH - i) for i in range(_LEVEL_BAR_LENGTH + 1))
+    for bar_char in ("🟥", "🟨", "🟩")
+}
+# Auto-refresh backoff bounds in seconds
+_MIN_REFRESH_INTERVAL = 2.0
+_MAX_REFRESH_INTERVAL = 60.0
+
+# Embed footer text, and how long a confirmation replaces it (seconds)
+_DEFAULT_FOOTER = "Use buttons below to adjust settings • Auto-refreshes while open"
+_NOTICE_DURATION = 5.0
+
+# custom_id prefix for EQ band buttons, stripped by slicing on dispatch
+_EQ_PREFIX = 'eq_'
+_EQ_PREFIX_LEN = len(_EQ_PREFIX)
+
+# EQ presets as read-only mappings; copy with dict() before handing them out
+_EQ_PRESETS: Mapping[str, Mapping[str, float]] = MappingProxyType({
+    name: MappingProxyType(bands) for name, bands in {
+        'flat': {'bass': 0.0, 'mid': 0.0, 'treble': 0.0},
+        'bass_boost': {'bass': 0.3, 'mid': 0.0, 'treble': 0.0},
+        'vocal': {'bass': -0.1, 'mid': 0.2, 'treble': 0.1},
+        'rock': {'bass': 0.2, 'mid': 0.0, 'treble': 0.2},
+        'jazz': {'bass': 0.1, 'mid': 0.1, 'treble': 0.0},
+        'electronic': {'bass': 0.3, 'mid': -0.1, 'treble': 0.2},
+        'classical': {'bass': 0.0, 'mid': 0.1, 'treble': 0.1},
+        'pop': {'bass': 0.1, 'mid': 0.0, 'treble': 0.1},
+        'broadcast': {'bass': -0.1, 'mid': 0.3, 'treble': 0.0}
+    }.items()
+})
+
+# One dropdown option per preset, shared by every dashboard
+_EQ_PRESET_OPTIONS = tuple(
+    discord.SelectOption(label=name.replace('_', ' ').title(), value=name)
+    for name in _EQ_PRESETS
+)
+
+
+class EQPresetSelect(discord.ui.Select):
+    """Dropdown offering every EQ preset as a single dashboard component"""
+    
+    def __init__(self, row: int = 2):
+        super().__init__(
+            placeholder="🎛️ Choose an EQ preset",
+            options=list(_EQ_PRESET_OPTIONS),
+            custom_id="eq_preset_select",
+            row=row
+        )
+    
+    async def callback(self, interaction: discord.Interaction) -> None:
+        await self.view._on_preset_select(interaction)
+
+
+class _MetricsBroker:
+    """
+    Shares one audio metrics poller per guild across all open dashboards.
+    
+    The first dashboard subscribing for a guild starts a polling task; each
+    snapshot is pushed to every subscribed view through ``_on_metrics`` and
+    kept in a single-slot ring so views can read the freshest one without
+    awaiting the processor. Views are held weakly, so a dashboard that is
+    dropped without unsubscribing is not kept alive; the task stops when
+    the last dashboard unsubscribes or no subscriber is still alive.
+    """
+    
+    def __init__(self, interval: float = AUTO_REFRESH_INTERVAL):
+        self._interval = interval
+        self._subscribers: Dict[int, 'weakref.WeakSet[AudioControlView]'] = {}
+        self._tasks: Dict[int, asyncio.Task] = {}
+        self._latest: Dict[int, Deque[Dict[str, Any]]] = {}
+    
+    def subscribe(self, guild_id: int, view: 'AudioControlView', audio_processor) -> None:
+        """Register a view for a guild's metrics, starting the poller if needed"""
+        self._subscribers.setdefault(guild_id, weakref.WeakSet()).add(view)
+        if guild_id in self._tasks:
+            return
+        
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # No loop yet; the view keeps reading metrics on demand
+            return
+        self._tasks[guild_id] = loop.create_task(self._poll(guild_id, audio_processor))
+    
+    def unsubscribe(self, guild_id: int, view: 'AudioControlView') -> None:
+        """Remove a view, stopping the guild's poller once nobody listens"""
+        subscribers = self._subscribers.get(guild_id)
+        if subscribers is None:
+            return
+        
+        subscribers.discard(view)
+        if not subscribers:
+            task = self._forget(guild_id)
+            if task is not None:
+                task.cancel()
+    
+    def _forget(self, guild_id: int) -> Optional[asyncio.Task]:
+        """Drop a guild's subscribers and snapshot, returning its poll task"""
+        self._subscribers.pop(guild_id, None)
+        self._latest.pop(guild_id, None)
+        return self._tasks.pop(guild_id, None)
+    
+    def latest(self, guild_id: int) -> Optional[Dict[str, Any]]:
+        """Freshest polled snapshot for the guild, without awaiting the processor"""
+        ring = self._latest.get(guild_id)
+        return ring[-1] if ring else None
+    
+    async def _poll(self, guild_id: int, audio_processor) -> None:
+        """Fetch metrics periodically and fan them out to subscribers"""
+        ring = self._latest.setdefault(guild_id, deque(maxlen=1))
+        while True:
+            # Every subscriber was garbage collected without unsubscribing
+            if not self._subscribers.get(guild_id):
+                self._forget(guild_id)
+                return
+            
+            try:
+                metrics = await audio_processor.get_audio_metrics(guild_id)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                _error_log.error_throttled("poll", "Error polling audio metrics for guild %s: %s", guild_id, e)
+                metrics = None
+            
+            if metrics:
+                ring.append(metrics)
+                self._publish(guild_id, metrics)
+            
+            await asyncio.sleep(self._interval)
+    
+    def _publish(self, guild_id: int, metrics: Dict[str, Any]) -> None:
+        """Push a snapshot to live subscribers without holding them past the call"""
+        for view in tuple(self._subscribers.get(guild_id, ())):
+            view._on_metrics(metrics)
+
+
+_METRICS_BROKER = _MetricsBroker()
+
+
+class _NullVolumeManager:
+    """Stand-in used when no volume manager is registered"""
+    
+    __slots__ = ()
+    
+    def __bool__(self) -> bool:
+        return False
+    
+    async def set_master_volume(self, guild_id: int, volume: float) -> bool:
+        return False
+    
+    async def get_master_volume(self, guild_id: int) -> Optional[float]:
+        return None
+
+
+class _NullEffectsChain:
+    """Stand-in used when no effects chain is registered"""
+    
+    __slots__ = ()
+    
+    def __bool__(self) -> bool:
+        return False
+    
+    async def set_equalizer_settings(self, guild_id: int, settings: Dict[str, float]) -> bool:
+        return False
+    
+    async def get_equalizer_settings(self, guild_id: int) -> Optional[Dict[str, float]]:
+        return None
+
+
+class _NullAudioProcessor:
+    """Stand-in used when no audio processor is registered"""
+    
+    __slots__ = ()
+    
+    def __bool__(self) -> bool:
+        return False
+    
+    async def get_audio_metrics(self, guild_id: int) -> Optional[Dict[str, Any]]:
+        return None
+
+
+# Shared null services; falsy so availability messages can still test for them
+_NULL_VOLUME_MANAGER = _NullVolumeManager()
+_NULL_EFFECTS_CHAIN = _NullEffectsChain()
+_NULL_AUDIO_PROCESSOR = _NullAudioProcessor()
+
+
+async def _no_result() -> None:
+    """Placeholder awaitable for services that are not registered"""
+    return None
+
+
 class AudioControlView(BaseView):
     """
     Interactive audio control dashboard with real-time feedback.
@@ -32,6 +286,32 @@ class AudioControlView(BaseView):
     - Audio processing status indicators
     """
     
+    # discord.ui.View keeps a __dict__ for its own state; slots cover this view's fields
+    __slots__ = (
+        'service_registry', 'guild_id',
+        'volume_manager', 'effects_chain', 'audio_processor',
+        'current_volume', 'current_eq', 'audio_metrics', 'is_processing',
+        'eq_controls', 'volume_slider', 'metrics_displays', 'status_indicators',
+        '_embed_cache', '_dirty', '_notice', '_notice_expires', '_last_display_key',
+        '_refresh_lock', '_refresh_pending',
+        '_next_refresh_interval', '_refresh_wakeup', '_refresh_task'
+    )
+    
+    # Dashboard embed field position for each dirty-trackable section
+    _FIELD_INDEX = {'volume': 0, 'eq': 1, 'metrics': 2, 'status': 3}
+    
+    # EQ Presets (shared, read-only)
+    eq_presets = _EQ_PRESETS
+    
+    # Static component layout, computed once per class
+    _EQ_BANDS = ('bass', 'mid', 'treble')
+    _UTILITY_BUTTONS = (
+        # (label, style, callback name, custom_id)
+        ("🔄 Refresh", discord.ButtonStyle.secondary, '_on_refresh', "refresh_audio"),
+        ("🔧 Reset", discord.ButtonStyle.danger, '_on_reset', "reset_audio"),
+        ("❌ Close", discord.ButtonStyle.secondary, '_on_close', "close_dashboard")
+    )
+    
     def __init__(self, service_registry: ServiceRegistry, guild_id: int):
         super().__init__(timeout=300)  # 5 minute timeout
         
@@ -39,9 +319,9 @@ class AudioControlView(BaseView):
         self.guild_id = guild_id
         
         # Get audio services
-        self.volume_manager = service_registry.get_optional(IVolumeManager)
-        self.effects_chain = service_registry.get_optional(IEffectsChain)
-        self.audio_processor = service_registry.get_optional(IAudioProcessor)
+        self.volume_manager = service_registry.get_optional(IVolumeManager) or _NULL_VOLUME_MANAGER
+        self.effects_chain = service_registry.get_optional(IEffectsChain) or _NULL_EFFECTS_CHAIN
+        self.audio_processor = service_registry.get_optional(IAudioProcessor) or _NULL_AUDIO_PROCESSOR
         
         # Current audio state
         self.current_volume = 0.8
@@ -52,23 +332,46 @@ class AudioControlView(BaseView):
         # UI Components
         self.eq_controls: Dict[str, discord.ui.Button] = {}
         
-        # EQ Presets
-        self.eq_presets = {
-            'flat': {'bass': 0.0, 'mid': 0.0, 'treble': 0.0},
-            'bass_boost': {'bass': 0.3, 'mid': 0.0, 'treble': 0.0},
-            'vocal': {'bass': -0.1, 'mid': 0.2, 'treble': 0.1},
-            'rock': {'bass': 0.2, 'mid': 0.0, 'treble': 0.2},
-            'jazz': {'bass': 0.1, 'mid': 0.1, 'treble': 0.0},
-            'electronic': {'bass': 0.3, 'mid': -0.1, 'treble': 0.2},
-            'classical': {'bass': 0.0, 'mid': 0.1, 'treble': 0.1},
-            'pop': {'bass': 0.1, 'mid': 0.0, 'treble': 0.1},
-            'broadcast': {'bass': -0.1, 'mid': 0.3, 'treble': 0.0}
-        }
+        # Dashboard embed cache; sections in _dirty are rebuilt on next render
+        self._embed_cache: Optional[discord.Embed] = None
+        self._dirty: Set[str] = {'all'}
+        
+        # Transient confirmation shown in the embed footer instead of a followup message
+        self._notice: Optional[str] = None
+        self._notice_expires = 0.0
+        
+        # State last pushed to Discord, so identical re-renders skip the message edit
+        self._last_display_key: Optional[tuple] = None
+        
+        # Background refresh coalescing
+        self._refresh_lock = asyncio.Lock()
+        self._refresh_pending = False
+        
+        # Auto-refresh cadence: fast right after an interaction, backing off while idle
+        self._next_refresh_interval = _MIN_REFRESH_INTERVAL
+        self._refresh_wakeup = asyncio.Event()
+        self._refresh_task: Optional[asyncio.Task] = None
         
         # Initialize components
         self._setup_components()
         
-        logger.info(f"AudioControlView initialized for guild {guild_id}")
+        logger.info("AudioControlView initialized for guild %s", guild_id)
+    
+    def set_message(self, message: discord.Message) -> None:
+        """Attach the sent dashboard message and start live updates"""
+        super().set_message(message)
+        
+        # Only dashboards that were actually sent join the per-guild poller
+        if self.audio_processor:
+            _METRICS_BROKER.subscribe(self.guild_id, self, self.audio_processor)
+        
+        # Auto-refresh edits this message, so it starts only once there is one
+        if self._refresh_task is None:
+            try:
+                self._refresh_task = asyncio.get_running_loop().create_task(self._auto_refresh_loop())
+            except RuntimeError:
+                # Attached outside an event loop; auto-refresh stays off
+                pass
     
     def _setup_components(self):
         """Set up all UI components for the audio control dashboard"""
@@ -83,26 +386,16 @@ class AudioControlView(BaseView):
         )
         
         # EQ Control Buttons
-        eq_bands = ['bass', 'mid', 'treble']
-        for band in eq_bands:
+        for band in self._EQ_BANDS:
             self.eq_controls[band] = Button(
-                label=f"{band.title()}: {self.current_eq[band]:+.1f}",
+                label=self._format_eq_label(band, self.current_eq[band]),
                 style=discord.ButtonStyle.secondary,
                 callback=self._on_eq_adjust,
-                custom_id=f"eq_{band}"
+                custom_id=f"{_EQ_PREFIX}{band}"
             )
         
-        # EQ Preset Buttons
-        preset_names = list(self.eq_presets.keys())[:9]  # Limit to 9 for Discord UI
-        for i, preset_name in enumerate(preset_names):
-            preset_button = Button(
-                label=preset_name.title(),
-                style=discord.ButtonStyle.primary,
-                callback=self._on_preset_select,
-                custom_id=f"preset_{preset_name}",
-                row=2 + (i // 3)  # Arrange in rows of 3
-            )
-            self.add_item(preset_button)
+        # EQ Preset dropdown (one component instead of a button per preset)
+        self.add_item(EQPresetSelect(row=2))
         
         # Audio Metrics Displays
         self.metrics_displays['rms'] = ProgressBar(
@@ -147,50 +440,27 @@ class AudioControlView(BaseView):
             self.add_item(band_button)
         
         # Add utility buttons
-        refresh_button = Button(
-            label="🔄 Refresh",
-            style=discord.ButtonStyle.secondary,
-            callback=self._on_refresh,
-            custom_id="refresh_audio",
-            row=4
-        )
-        
-        reset_button = Button(
-            label="🔧 Reset",
-            style=discord.ButtonStyle.danger,
-            callback=self._on_reset,
-            custom_id="reset_audio",
-            row=4
-        )
-        
-        close_button = Button(
-            label="❌ Close",
-            style=discord.ButtonStyle.secondary,
-            callback=self._on_close,
-            custom_id="close_dashboard",
-            row=4
-        )
-        
-        self.add_item(refresh_button)
-        self.add_item(reset_button)
-        self.add_item(close_button)
+        for label, style, callback_name, custom_id in self._UTILITY_BUTTONS:
+            self.add_item(Button(
+                label=label,
+                style=style,
+                callback=getattr(self, callback_name),
+                custom_id=custom_id,
+                row=4
+            ))
     
+    @deferred_callback
     async def _on_volume_change(self, interaction: discord.Interaction, volume: float):
         """Handle volume slider changes"""
         try:
-            await interaction.response.defer()
-            
             if self.volume_manager:
                 success = await self.volume_manager.set_master_volume(self.guild_id, volume)
                 if success:
                     self.current_volume = volume
+                    self._mark_dirty('volume')
+                    self._set_notice(f"🔊 Volume set to {int(volume * 100)}%")
                     await self._update_audio_metrics()
                     await self._update_display(interaction)
-                    
-                    await interaction.followup.send(
-                        f"🔊 Volume set to {int(volume * 100)}%",
-                        ephemeral=True
-                    )
                 else:
                     await interaction.followup.send(
                         "❌ Failed to set volume",
@@ -203,7 +473,7 @@ class AudioControlView(BaseView):
                 )
                 
         except Exception as e:
-            logger.error(f"Error changing volume: {e}")
+            _error_log.error_throttled("volume", "Error changing volume: %s", e)
             await interaction.followup.send(
                 "❌ Error adjusting volume",
                 ephemeral=True
@@ -211,9 +481,9 @@ class AudioControlView(BaseView):
     
     async def _on_eq_adjust(self, interaction: discord.Interaction):
         """Handle EQ band adjustment"""
+        # Modals cannot follow a defer, so respond with the modal as soon as possible
+        band = interaction.data['custom_id'][_EQ_PREFIX_LEN:]
         try:
-            band = interaction.data['custom_id'].replace('eq_', '')
-            
             # Show EQ adjustment modal
             from ui.components.modal import EQAdjustModal
             modal = EQAdjustModal(
@@ -225,7 +495,7 @@ class AudioControlView(BaseView):
             await interaction.response.send_modal(modal)
             
         except Exception as e:
-            logger.error(f"Error in EQ adjust: {e}")
+            _error_log.error_throttled("eq_adjust", "Error in EQ adjust: %s", e)
             await interaction.response.send_message(
                 "❌ Error adjusting EQ",
                 ephemeral=True
@@ -234,36 +504,35 @@ class AudioControlView(BaseView):
     async def _apply_eq_change(self, band: str, value: float):
         """Apply EQ change to audio system"""
         try:
-            if self.effects_chain:
-                # Update EQ settings
-                eq_settings = self.current_eq.copy()
-                eq_settings[band] = max(-1.0, min(1.0, value))  # Clamp to valid range
-                
-                success = await self.effects_chain.set_equalizer_settings(
-                    self.guild_id, eq_settings
-                )
-                
-                if success:
-                    self.current_eq = eq_settings
-                    # Update button label
-                    self.eq_controls[band].label = f"{band.title()}: {value:+.1f}"
-                    return True
+            # Update EQ settings
+            eq_settings = self.current_eq.copy()
+            eq_settings[band] = max(-1.0, min(1.0, value))  # Clamp to valid range
+            
+            success = await self.effects_chain.set_equalizer_settings(
+                self.guild_id, eq_settings
+            )
+            
+            if success:
+                self.current_eq = eq_settings
+                self._mark_dirty('eq')
+                self._refresh_eq_labels()
+                return True
             
             return False
             
         except Exception as e:
-            logger.error(f"Error applying EQ change: {e}")
+            _error_log.error_throttled("eq_apply", "Error applying EQ change: %s", e)
             return False
     
+    @deferred_callback
     async def _on_preset_select(self, interaction: discord.Interaction):
         """Handle EQ preset selection"""
         try:
-            await interaction.response.defer()
+            values = interaction.data.get('values') or ('',)
+            preset_name = values[0]
+            preset = self.eq_presets.get(preset_name)
             
-            preset_name = interaction.data['custom_id'].replace('preset_', '')
-            preset_eq = self.eq_presets.get(preset_name)
-            
-            if not preset_eq:
+            if not preset:
                 await interaction.followup.send(
                     "❌ Unknown preset",
                     ephemeral=True
@@ -271,24 +540,19 @@ class AudioControlView(BaseView):
                 return
             
             if self.effects_chain:
+                preset_eq = dict(preset)
                 success = await self.effects_chain.set_equalizer_settings(
                     self.guild_id, preset_eq
                 )
                 
                 if success:
-                    self.current_eq = preset_eq.copy()
+                    self.current_eq = preset_eq
+                    self._mark_dirty('eq')
                     
-                    # Update EQ button labels
-                    for band, value in preset_eq.items():
-                        if band in self.eq_controls:
-                            self.eq_controls[band].label = f"{band.title()}: {value:+.1f}"
+                    self._refresh_eq_labels()
+                    self._set_notice(f"🎛️ Applied {preset_name.replace('_', ' ').title()} EQ preset")
                     
                     await self._update_display(interaction)
-                    
-                    await interaction.followup.send(
-                        f"🎛️ Applied {preset_name.title()} EQ preset",
-                        ephemeral=True
-                    )
                 else:
                     await interaction.followup.send(
                         "❌ Failed to apply EQ preset",
@@ -301,76 +565,73 @@ class AudioControlView(BaseView):
                 )
                 
         except Exception as e:
-            logger.error(f"Error applying preset: {e}")
+            _error_log.error_throttled("preset", "Error applying preset: %s", e)
             await interaction.followup.send(
                 "❌ Error applying preset",
                 ephemeral=True
             )
     
+    @deferred_callback
     async def _on_refresh(self, interaction: discord.Interaction):
         """Handle refresh button click"""
         try:
-            await interaction.response.defer()
-            
             # Update current audio state from services
             await self._update_audio_state()
-            await self._update_display(interaction)
             
-            await interaction.followup.send(
-                "🔄 Audio dashboard refreshed",
-                ephemeral=True
-            )
+            # Skip the message edit when the refresh changed nothing on screen,
+            # but still acknowledge the press privately
+            if self._dirty or self._embed_cache is None:
+                self._set_notice("🔄 Audio dashboard refreshed")
+                await self._update_display(interaction)
+            else:
+                await interaction.followup.send(
+                    "🔄 Audio dashboard is already up to date",
+                    ephemeral=True
+                )
             
         except Exception as e:
-            logger.error(f"Error refreshing dashboard: {e}")
+            _error_log.error_throttled("refresh", "Error refreshing dashboard: %s", e)
             await interaction.followup.send(
                 "❌ Error refreshing dashboard",
                 ephemeral=True
             )
     
+    @deferred_callback
     async def _on_reset(self, interaction: discord.Interaction):
         """Handle reset button click"""
         try:
-            await interaction.response.defer()
-            
-            # Reset to default values
-            if self.volume_manager:
-                await self.volume_manager.set_master_volume(self.guild_id, 0.8)
+            # Reset volume and EQ to default values concurrently
+            default_eq = {'bass': 0.0, 'mid': 0.0, 'treble': 0.0}
+            await asyncio.gather(
+                self.volume_manager.set_master_volume(self.guild_id, 0.8),
+                self.effects_chain.set_equalizer_settings(self.guild_id, default_eq)
+            )
             
             if self.effects_chain:
-                default_eq = {'bass': 0.0, 'mid': 0.0, 'treble': 0.0}
-                await self.effects_chain.set_equalizer_settings(self.guild_id, default_eq)
                 self.current_eq = default_eq
             
             self.current_volume = 0.8
+            self._mark_dirty('volume', 'eq')
             
-            # Update button labels
-            for band, value in self.current_eq.items():
-                if band in self.eq_controls:
-                    self.eq_controls[band].label = f"{band.title()}: {value:+.1f}"
+            self._refresh_eq_labels()
+            self._set_notice("🔧 Audio settings reset to defaults")
             
             await self._update_display(interaction)
             
-            await interaction.followup.send(
-                "🔧 Audio settings reset to defaults",
-                ephemeral=True
-            )
-            
         except Exception as e:
-            logger.error(f"Error resetting audio: {e}")
+            _error_log.error_throttled("reset", "Error resetting audio: %s", e)
             await interaction.followup.send(
                 "❌ Error resetting audio settings",
                 ephemeral=True
             )
     
+    @deferred_callback
     async def _on_close(self, interaction: discord.Interaction):
         """Handle close button click"""
+        self._stop_background_work()
         try:
-            await interaction.response.defer()
-            
             # Disable all components
-            for item in self.children:
-                item.disabled = True
+            self.disable_all_items()
             
             await interaction.edit_original_response(
                 content="🎛️ Audio Control Dashboard closed",
@@ -380,79 +641,206 @@ class AudioControlView(BaseView):
             self.stop()
             
         except Exception as e:
-            logger.error(f"Error closing dashboard: {e}")
+            _error_log.error_throttled("close", "Error closing dashboard: %s", e)
             await interaction.followup.send(
                 "❌ Error closing dashboard",
                 ephemeral=True
             )
     
     async def _update_audio_state(self):
-        """Update current audio state from services"""
+        """Update current audio state from services, querying them concurrently"""
         try:
-            if self.volume_manager:
-                self.current_volume = await self.volume_manager.get_master_volume(self.guild_id)
+            # Metrics come from the shared poller's latest snapshot when it has one;
+            # before its first poll completes, ask the processor directly
+            metrics = _METRICS_BROKER.latest(self.guild_id)
+            volume, eq_settings, fetched_metrics = await asyncio.gather(
+                self.volume_manager.get_master_volume(self.guild_id),
+                self.effects_chain.get_equalizer_settings(self.guild_id),
+                _no_result() if metrics is not None else self.audio_processor.get_audio_metrics(self.guild_id),
+                return_exceptions=True
+            )
+            if metrics is None:
+                metrics = fetched_metrics
             
-            if self.effects_chain:
-                eq_settings = await self.effects_chain.get_equalizer_settings(self.guild_id)
-                if eq_settings:
-                    self.current_eq = eq_settings
+            if isinstance(volume, Exception):
+                _error_log.error_throttled("read_volume", "Error reading master volume: %s", volume)
+            elif volume is not None and volume != self.current_volume:
+                self.current_volume = volume
+                self._mark_dirty('volume')
+            
+            if isinstance(eq_settings, Exception):
+                _error_log.error_throttled("read_eq", "Error reading equalizer settings: %s", eq_settings)
+            elif eq_settings and eq_settings != self.current_eq:
+                self.current_eq = eq_settings
+                self._mark_dirty('eq')
             
-            await self._update_audio_metrics()
+            if isinstance(metrics, Exception):
+                _error_log.error_throttled("metrics", "Error updating audio metrics: %s", metrics)
+            else:
+                self._apply_audio_metrics(metrics)
             
         except Exception as e:
-            logger.error(f"Error updating audio state: {e}")
+            _error_log.error_throttled("state", "Error updating audio state: %s", e)
     
     async def _update_audio_metrics(self):
         """Update audio metrics from processor"""
+        # Read the shared poller's latest snapshot instead of awaiting the processor;
+        # fall through when it has not completed a poll yet
+        snapshot = _METRICS_BROKER.latest(self.guild_id)
+        if snapshot is not None:
+            self._apply_audio_metrics(snapshot)
+            return
+        
         try:
-            if self.audio_processor:
-                metrics = await self.audio_processor.get_audio_metrics(self.guild_id)
-                if metrics:
-                    self.audio_metrics.update(metrics)
-                    self.is_processing = metrics.get('is_processing', False)
+            metrics = await self.audio_processor.get_audio_metrics(self.guild_id)
+            self._apply_audio_metrics(metrics)
             
         except Exception as e:
-            logger.error(f"Error updating audio metrics: {e}")
+            _error_log.error_throttled("metrics", "Error updating audio metrics: %s", e)
+    
+    def _on_metrics(self, metrics: Dict[str, Any]) -> None:
+        """Receive a metrics snapshot from the shared per-guild poller"""
+        self._apply_audio_metrics(metrics)
+    
+    def _apply_audio_metrics(self, metrics: Optional[Dict[str, Any]]) -> None:
+        """Merge a metrics snapshot into the view state"""
+        if not metrics:
+            return
+        
+        # Unchanged snapshots leave the cached embed (and its timestamp) alone
+        audio_metrics = self.audio_metrics
+        if any(audio_metrics.get(key) != value for key, value in metrics.items()):
+            audio_metrics.update(metrics)
+            self._mark_dirty('metrics')
+        
+        is_processing = metrics.get('is_processing', False)
+        if is_processing != self.is_processing:
+            self.is_processing = is_processing
+            self._mark_dirty('status')
     
     async def _update_display(self, interaction: discord.Interaction):
-        """Update the dashboard display"""
+        """Update the dashboard display, skipping the edit when nothing visible changed"""
         try:
             embed = self._create_dashboard_embed()
+            
+            display_key = self._display_state_key()
+            if display_key is not None and display_key == self._last_display_key:
+                return
+            
             await interaction.edit_original_response(embed=embed, view=self)
+            self._last_display_key = display_key
             
         except Exception as e:
-            logger.error(f"Error updating display: {e}")
+            _error_log.error_throttled("display", "Error updating display: %s", e)
     
-    def _create_dashboard_embed(self) -> discord.Embed:
-        """Create the main dashboard embed"""
-        embed = discord.Embed(
-            title="🎛️ Audio Control Dashboard",
-            description="Real-time audio controls and metrics",
-            color=0x00ff88,
-            timestamp=datetime.now()
+    @staticmethod
+    def _format_eq_label(band: str, value: float) -> str:
+        """Format the label shown on an EQ band button"""
+        return f"{band.title()}: {value:+.1f}"
+    
+    def _refresh_eq_labels(self) -> None:
+        """Sync all EQ band button labels with the current EQ settings in one pass"""
+        eq_controls = self.eq_controls
+        for band, value in self.current_eq.items():
+            button = eq_controls.get(band)
+            if button is not None:
+                label = self._format_eq_label(band, value)
+                if button.label != label:
+                    button.label = label
+    
+    def _set_notice(self, text: str) -> None:
+        """Show a short-lived confirmation in the dashboard footer"""
+        self._notice = text
+        self._notice_expires = time.monotonic() + _NOTICE_DURATION
+        self._mark_dirty('footer')
+    
+    def _footer_text(self) -> str:
+        """Current footer: an active confirmation, or the usage hint"""
+        return self._notice if self._notice is not None else _DEFAULT_FOOTER
+    
+    def _mark_dirty(self, *sections: str) -> None:
+        """Flag dashboard sections whose embed fields must be rebuilt"""
+        self._dirty.update(sections)
+    
+    def _display_state_key(self) -> Optional[tuple]:
+        """Hashable snapshot of everything the dashboard message shows, or None if unhashable"""
+        key = (
+            self.current_volume,
+            tuple(self.current_eq.items()),
+            tuple(self.audio_metrics.items()),
+            self.is_processing,
+            self._footer_text()
         )
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return key
+    
+    def _create_dashboard_embed(self) -> discord.Embed:
+        """Create the main dashboard embed, rebuilding only sections that changed"""
+        # Expired confirmations fall back to the usage hint on the next render
+        if self._notice is not None and time.monotonic() >= self._notice_expires:
+            self._notice = None
+            self._mark_dirty('footer')
+        
+        embed = self._embed_cache
+        if embed is not None and not self._dirty:
+            return embed
+        
+        # Only a state change reaches this point, so the timestamp marks the last change
+        now = datetime.now()
+        if embed is None or 'all' in self._dirty:
+            embed = discord.Embed(
+                title="🎛️ Audio Control Dashboard",
+                description="Real-time audio controls and metrics",
+                color=0x00ff88,
+                timestamp=now
+            )
+            embed.add_field(name="🔊 Master Volume", value=self._volume_field_value(), inline=False)
+            embed.add_field(name="🎚️ Equalizer", value=self._eq_field_value(), inline=True)
+            embed.add_field(name="📊 Audio Metrics", value=self._metrics_field_value(), inline=True)
+            embed.add_field(name="⚡ Processing Status", value=self._status_field_value(), inline=False)
+            
+            # Footer with instructions or the latest confirmation
+            embed.set_footer(text=self._footer_text())
+        else:
+            if 'footer' in self._dirty:
+                embed.set_footer(text=self._footer_text())
+            
+            # Patch only the fields whose state changed
+            for section in self._dirty:
+                index = self._FIELD_INDEX.get(section)
+                if index is None:
+                    continue
+                field = embed.fields[index]
+                embed.set_field_at(
+                    index,
+                    name=field.name,
+                    value=getattr(self, f"_{section}_field_value")(),
+                    inline=field.inline
+                )
+            embed.timestamp = now
         
-        # Volume Section
+        self._embed_cache = embed
+        self._dirty.clear()
+        return embed
+    
+    def _volume_field_value(self) -> str:
+        """Render the master volume field"""
         volume_bar = self._create_progress_bar(self.current_volume, 1.0, 20)
-        embed.add_field(
-            name="🔊 Master Volume",
-            value=f"{volume_bar} {int(self.current_volume * 100)}%",
-            inline=False
-        )
-        
-        # EQ Section
+        return f"{volume_bar} {int(self.current_volume * 100)}%"
+    
+    def _eq_field_value(self) -> str:
+        """Render the equalizer field"""
         eq_display = ""
         for band, value in self.current_eq.items():
             bar = self._create_eq_bar(value)
             eq_display += f"**{band.title()}:** {bar} {value:+.1f}\n"
-        
-        embed.add_field(
-            name="🎚️ Equalizer",
-            value=eq_display,
-            inline=True
-        )
-        
-        # Audio Metrics
+        return eq_display
+    
+    def _metrics_field_value(self) -> str:
+        """Render the audio metrics field"""
         metrics_display = ""
         rms_bar = self._create_level_bar(self.audio_metrics['rms_db'], -60, 0)
         peak_bar = self._create_level_bar(self.audio_metrics['peak_db'], -60, 0)
@@ -460,44 +848,34 @@ class AudioControlView(BaseView):
         metrics_display += f"**RMS:** {rms_bar} {self.audio_metrics['rms_db']:.1f} dB\n"
         metrics_display += f"**Peak:** {peak_bar} {self.audio_metrics['peak_db']:.1f} dB\n"
         metrics_display += f"**LUFS:** {self.audio_metrics['lufs']:.1f}\n"
-        
-        embed.add_field(
-            name="📊 Audio Metrics",
-            value=metrics_display,
-            inline=True
-        )
-        
-        # Status Indicators
+        return metrics_display
+    
+    def _status_field_value(self) -> str:
+        """Render the processing status field"""
         status_display = ""
         for name, indicator in self.status_indicators.items():
             status_icon = "🟢" if indicator.status else "🔴"
             status_display += f"{status_icon} {indicator.label}\n"
-        
-        embed.add_field(
-            name="⚡ Processing Status",
-            value=status_display,
-            inline=False
-        )
-        
-        # Footer with instructions
-        embed.set_footer(text="Use buttons below to adjust settings • Auto-refresh every 30s")
-        
-        return embed
+        return status_display
     
     def _create_progress_bar(self, value: float, max_value: float, length: int = 20) -> str:
         """Create a text-based progress bar"""
-        filled_length = int(length * (value / max_value))
+        filled_length = max(0, min(length, int(length * (value / max_value))))
+        if length == _PROGRESS_BAR_LENGTH:
+            return _PROGRESS_BARS[filled_length]
         bar = "█" * filled_length + "░" * (length - filled_length)
         return f"`{bar}`"
     
     def _create_eq_bar(self, value: float, length: int = 10) -> str:
         """Create EQ visualization bar"""
         center = length // 2
+        filled = min(center, int(abs(value) * center))
+        if length == _EQ_BAR_LENGTH:
+            return _EQ_BARS_POS[filled] if value > 0 else _EQ_BARS_NEG[filled]
+        
         if value > 0:
-            filled = int(value * center)
             bar = "░" * center + "█" * filled + "░" * (center - filled)
         else:
-            filled = int(abs(value) * center)
             bar = "░" * (center - filled) + "█" * filled + "░" * center
         
         return f"`{bar}`"
@@ -515,26 +893,81 @@ class AudioControlView(BaseView):
         else:
             bar_char = "🟩"  # Green - good level
         
+        if length == _LEVEL_BAR_LENGTH:
+            return _LEVEL_BARS[bar_char][filled_length]
+        
         empty_char = "⬜"
         bar = bar_char * filled_length + empty_char * (length - filled_length)
         return bar
     
+    async def interaction_check(self, interaction: discord.Interaction) -> bool:
+        """Reset the auto-refresh cadence on every dashboard interaction"""
+        self._next_refresh_interval = _MIN_REFRESH_INTERVAL
+        self._refresh_wakeup.set()
+        return True
+    
+    async def _auto_refresh_loop(self):
+        """Refresh state with inverse-exponential backoff until the view finishes"""
+        while not self.is_finished():
+            try:
+                await asyncio.wait_for(self._refresh_wakeup.wait(), timeout=self._next_refresh_interval)
+                # An interaction reset the cadence; restart the wait at the short interval
+                self._refresh_wakeup.clear()
+                continue
+            except asyncio.TimeoutError:
+                pass
+            
+            await self.refresh_dashboard()
+            self._next_refresh_interval = min(self._next_refresh_interval * 2, _MAX_REFRESH_INTERVAL)
+    
+    def _stop_background_work(self) -> None:
+        """Detach from the metrics poller and stop auto-refreshing"""
+        _METRICS_BROKER.unsubscribe(self.guild_id, self)
+        if self._refresh_task is not None:
+            self._refresh_task.cancel()
+            self._refresh_task = None
+    
     async def refresh_dashboard(self):
         """Auto-refresh the dashboard (called by background task)"""
+        # Coalesce overlapping refreshes: a caller arriving mid-refresh only
+        # requests one more pass instead of racing the running one
+        if self._refresh_lock.locked():
+            self._refresh_pending = True
+            return
+        
         try:
-            await self._update_audio_state()
-            # Note: We don't update the display here to avoid conflicts
-            # The display will update on next user interaction
+            async with self._refresh_lock:
+                self._refresh_pending = True
+                while self._refresh_pending:
+                    self._refresh_pending = False
+                    await self._update_audio_state()
+                    await self._update_message()
             
+        except discord.NotFound:
+            # Dashboard message was deleted; nothing left to refresh
+            self._stop_background_work()
         except Exception as e:
-            logger.error(f"Error in auto-refresh: {e}")
+            _error_log.error_throttled("auto_refresh", "Error in auto-refresh: %s", e)
+    
+    async def _update_message(self) -> None:
+        """Edit the attached dashboard message when its visible state changed"""
+        if self.message is None:
+            return
+        
+        embed = self._create_dashboard_embed()
+        display_key = self._display_state_key()
+        if display_key is not None and display_key == self._last_display_key:
+            return
+        
+        await self.message.edit(embed=embed, view=self)
+        self._last_display_key = display_key
     
     async def on_timeout(self):
         """Handle view timeout"""
+        self._stop_background_work()
         try:
             # Disable all components
-            for item in self.children:
-                item.disabled = True
+            self.disable_all_items()
             
             # Try to edit the message if possible
             if hasattr(self, 'message') and self.message:
@@ -547,7 +980,7 @@ class AudioControlView(BaseView):
                     pass  # Message might be deleted
             
         except Exception as e:
-            logger.error(f"Error handling timeout: {e}")
+            logger.error("Error handling timeout: %s", e)
 
 
 async def create_audio_dashboard(service_registry: ServiceRegistry, 
@@ -555,6 +988,9 @@ async def create_audio_dashboard(service_registry: ServiceRegistry,
     """
     Factory function to create an audio control dashboard.
     
+    Call ``set_message()`` on the returned view once its message has been
+    sent; live metrics and auto-refresh start only then.
+    
     Args:
         service_registry: Service registry instance
         guild_id: Discord guild ID
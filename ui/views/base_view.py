@@ -3,11 +3,38 @@ Base View for BunBot UI System
 """
 
 import discord
-from typing import Optional, Any
+import functools
+from typing import Optional, Any, Callable, Awaitable, List
 import logging
 
 logger = logging.getLogger('ui.views.base_view')
 
+def deferred_callback(func: Callable[..., Awaitable[Any]]) -> Callable[..., Awaitable[Any]]:
+    """
+    Decorator that acknowledges an interaction before running a view callback.
+    
+    Deferring first keeps slow callbacks inside Discord's 3 second
+    acknowledgement window. For component interactions the defer is a
+    deferred message update, so the callback can edit the view's message
+    through ``edit_original_response``; replies meant for the user alone
+    go through ``followup.send(..., ephemeral=True)``.
+    
+    Args:
+        func: ``async def callback(self, interaction, ...)`` view method
+        
+    Returns:
+        Wrapped callback
+    """
+    @functools.wraps(func)
+    async def wrapper(self, interaction: discord.Interaction, *args, **kwargs):
+        if not interaction.response.is_done():
+            try:
+                await interaction.response.defer()
+            except discord.InteractionResponded:
+                pass
+        return await func(self, interaction, *args, **kwargs)
+    return wrapper
+
 class BaseView(discord.ui.View):
     """
     Base view class for BunBot UI components.
@@ -18,15 +45,43 @@ class BaseView(discord.ui.View):
         super().__init__(timeout=timeout)
         self.message: Optional[discord.Message] = None
         self.interaction: Optional[discord.Interaction] = None
+        
+        # Items that can be disabled, tracked as they are added so shutdown needs no hasattr scan
+        self._disableable_children: List[discord.ui.Item[Any]] = [
+            item for item in self.children if hasattr(item, 'disabled')
+        ]
+    
+    def add_item(self, item: discord.ui.Item[Any]) -> 'BaseView':
+        """Add item to the view, tracking it if it can be disabled"""
+        super().add_item(item)
+        if hasattr(item, 'disabled'):
+            self._disableable_children.append(item)
+        return self
+    
+    def remove_item(self, item: discord.ui.Item[Any]) -> 'BaseView':
+        """Remove item from the view and stop tracking it"""
+        super().remove_item(item)
+        if item in self._disableable_children:
+            self._disableable_children.remove(item)
+        return self
+    
+    def clear_items(self) -> 'BaseView':
+        """Remove all items from the view"""
+        super().clear_items()
+        self._disableable_children.clear()
+        return self
+    
+    def disable_all_items(self) -> None:
+        """Disable every item that supports it"""
+        for item in self._disableable_children:
+            item.disabled = True
     
     async def on_timeout(self) -> None:
         """Called when the view times out"""
         try:
             if self.message:
                 # Disable all components when timeout occurs
-                for item in self.children:
-                    if hasattr(item, 'disabled'):
-                        item.disabled = True
+                self.disable_all_items()
                 
                 # Try to edit the message to show disabled state
                 await self.message.edit(view=self)
@@ -6,7 +6,7 @@ pagination, and real-time controls for adding/removing favorites.
 """
 
 import logging
-import math
+import asyncio
 from typing import List, Dict, Any, Optional
 import discord
 
@@ -16,6 +16,10 @@ from ..interfaces import ComponentTheme
 
 logger = logging.getLogger('discord.ui.views.favorites_view')
 
+async def _no_button() -> None:
+    """Placeholder render for a navigation button that is not shown"""
+    return None
+
 class FavoritesView(BaseView):
     """
     Favorites management view with interactive buttons.
@@ -31,42 +35,90 @@ class FavoritesView(BaseView):
         
         self.theme = theme
         self.guild_id = guild_id
-        self.favorites_list = favorites_list
+        # Snapshot of the favorites; pagination, labels and buttons are derived
+        # from it once, so changed favorites need a new view
+        self.favorites_list = list(favorites_list)
         self.service_registry = service_registry
         self.current_page = page
         self.favorites_per_page = favorites_per_page
         
-        # Calculate pagination
-        self.total_pages = max(1, math.ceil(len(favorites_list) / favorites_per_page))
+        # Theme is fixed for the view's lifetime, so parse the embed color once
+        self._primary_color = discord.Color.from_str(theme.colors.primary)
+        
+        # Calculate pagination with integer ceiling division
+        favorite_count = len(favorites_list)
+        self.total_pages = 1 if favorite_count == 0 else (favorite_count + favorites_per_page - 1) // favorites_per_page
         self.current_page = max(0, min(page, self.total_pages - 1))
+        self._is_paginated = self.total_pages > 1
+        self._has_favorites = bool(favorites_list)
+        
+        # Embed text that does not depend on the current page
+        self._title_base = "📻 Favorite Stations"
+        self._desc_header = f"**{len(favorites_list)} favorite stations** • Click a button to play!"
         
         # Component tracking
         self._favorite_buttons: List[FavoriteButton] = []
         self._navigation_buttons: List[NavigationButton] = []
         self._action_buttons: List[ActionButton] = []
+        self._page_indicator: Optional[discord.ui.Button] = None
+        
+        # Favorite numbers and prev/next availability of the last completed build
+        self._last_built_page_key: Optional[tuple] = None
+        self._last_nav_state: Optional[tuple] = None
+        
+        # Favorite buttons kept across page navigations, keyed by favorite number
+        self._rendered_cache: Dict[int, FavoriteButton] = {}
+        
+        # Embed line for every favorite, formatted once
+        self._formatted_labels = [
+            f"**{fav['favorite_number']}.** {fav['station_name']}" for fav in favorites_list
+        ]
+        
+        # Favorites shown on the current page
+        self._compute_page_slice()
         
         logger.info(f"Created FavoritesView for guild {guild_id}: "
                    f"{len(favorites_list)} favorites, page {self.current_page}/{self.total_pages}")
     
+    def _compute_page_slice(self) -> None:
+        """Recompute the current page's boundaries and favorites slice"""
+        self._page_start = self.current_page * self.favorites_per_page
+        self._page_end = min(self._page_start + self.favorites_per_page, len(self.favorites_list))
+        self._page_slice = self.favorites_list[self._page_start:self._page_end]
+    
     async def _build_view(self) -> None:
         """Build the complete favorites view with all components"""
         try:
+            page_key = tuple(fav['favorite_number'] for fav in self._page_slice)
+            nav_state = (self.current_page > 0, self.current_page < self.total_pages - 1)
+            
+            # Same favorites and navigation buttons as the last build: only the page label can differ
+            if page_key == self._last_built_page_key and nav_state == self._last_nav_state:
+                if self._page_indicator is not None:
+                    self._page_indicator.label = f"Page {self.current_page + 1}/{self.total_pages}"
+                logger.debug("Favorites page contents unchanged, kept existing components")
+                return
+            
             # Clear existing items
             self.clear_items()
             self._favorite_buttons.clear()
             self._navigation_buttons.clear()
             self._action_buttons.clear()
+            self._page_indicator = None
             
             # Add favorite buttons for current page
             await self._add_favorite_buttons()
             
             # Add navigation buttons if multiple pages
-            if self.total_pages > 1:
+            if self._is_paginated:
                 await self._add_navigation_buttons()
             
             # Add action buttons (add/remove favorites)
             await self._add_action_buttons()
             
+            self._last_built_page_key = page_key
+            self._last_nav_state = nav_state
+            
             logger.debug(f"Built FavoritesView: {len(self._favorite_buttons)} favorites, "
                         f"{len(self._navigation_buttons)} nav, {len(self._action_buttons)} actions")
             
@@ -75,152 +127,160 @@ class FavoritesView(BaseView):
     
     async def _add_favorite_buttons(self) -> None:
         """Add favorite station buttons for the current page"""
-        try:
-            # Calculate page boundaries
-            start_index = self.current_page * self.favorites_per_page
-            end_index = min(start_index + self.favorites_per_page, len(self.favorites_list))
-            
-            # Add favorite buttons for current page
-            for i in range(start_index, end_index):
-                favorite = self.favorites_list[i]
-                
-                # Create favorite button
-                button = FavoriteButton(
-                    component_id=f"favorite_{favorite['favorite_number']}",
-                    theme=self.theme,
-                    favorite_number=favorite['favorite_number'],
-                    station_name=favorite['station_name'],
-                    stream_url=favorite['stream_url'],
-                    service_registry=self.service_registry,
-                    category=favorite.get('category')
-                )
-                
-                # Render and add to view
-                discord_button = await button.render()
-                self.add_item(discord_button)
-                self._favorite_buttons.append(button)
-            
-            # If no favorites on this page, add a message
-            if start_index >= len(self.favorites_list):
-                # Create an informational button (disabled)
-                info_button = discord.ui.Button(
-                    style=discord.ButtonStyle.secondary,
-                    label="No favorites on this page",
-                    emoji="📻",
-                    disabled=True
-                )
-                self.add_item(info_button)
-                
-        except Exception as e:
-            logger.error(f"Error adding favorite buttons: {e}")
+        page_favorites = self._page_slice
+        cache = self._rendered_cache
+        
+        # Create buttons not seen on an earlier page with a single service lookup
+        missing = [
+            favorite for favorite in page_favorites
+            if favorite['favorite_number'] not in cache
+        ]
+        if missing:
+            created = FavoriteButton.create_many(self.service_registry, [
+                {
+                    'component_id': f"favorite_{favorite['favorite_number']}",
+                    'theme': self.theme,
+                    'favorite_number': favorite['favorite_number'],
+                    'station_name': favorite['station_name'],
+                    'stream_url': favorite['stream_url'],
+                    'category': favorite.get('category')
+                }
+                for favorite in missing
+            ])
+            for button in created:
+                cache[button.favorite_number] = button
+        
+        # Render concurrently (reuses Discord buttons whose state did not change),
+        # then add to view in page order
+        buttons = [cache[favorite['favorite_number']] for favorite in page_favorites]
+        rendered = await asyncio.gather(*(button.render() for button in buttons))
+        for button, discord_button in zip(buttons, rendered):
+            self.add_item(discord_button)
+            self._favorite_buttons.append(button)
+        
+        # If no favorites on this page, add a message
+        if not page_favorites:
+            # Create an informational button (disabled)
+            info_button = discord.ui.Button(
+                style=discord.ButtonStyle.secondary,
+                label="No favorites on this page",
+                emoji="📻",
+                disabled=True
+            )
+            self.add_item(info_button)
     
     async def _add_navigation_buttons(self) -> None:
         """Add pagination navigation buttons"""
-        try:
-            # Previous page button
-            if self.current_page > 0:
-                prev_button = NavigationButton(
-                    component_id="nav_prev",
-                    theme=self.theme,
-                    label="◀ Previous",
-                    target_view="favorites",
-                    current_page=self.current_page,
-                    target_page=self.current_page - 1,
-                    emoji="◀"
-                )
-                
-                # Custom callback for navigation
-                async def prev_callback(interaction: discord.Interaction):
-                    await self._navigate_to_page(interaction, self.current_page - 1)
-                
-                discord_prev = await prev_button.render()
-                discord_prev.callback = prev_callback
-                self.add_item(discord_prev)
-                self._navigation_buttons.append(prev_button)
-            
-            # Page indicator (disabled button showing current page)
-            page_button = discord.ui.Button(
-                style=discord.ButtonStyle.secondary,
-                label=f"Page {self.current_page + 1}/{self.total_pages}",
-                emoji="📄",
-                disabled=True
+        prev_button = None
+        next_button = None
+        
+        # Previous page button
+        if self.current_page > 0:
+            prev_button = NavigationButton(
+                component_id="nav_prev",
+                theme=self.theme,
+                label="◀ Previous",
+                target_view="favorites",
+                current_page=self.current_page,
+                target_page=self.current_page - 1,
+                emoji="◀"
             )
-            self.add_item(page_button)
-            
-            # Next page button
-            if self.current_page < self.total_pages - 1:
-                next_button = NavigationButton(
-                    component_id="nav_next",
-                    theme=self.theme,
-                    label="Next ▶",
-                    target_view="favorites",
-                    current_page=self.current_page,
-                    target_page=self.current_page + 1,
-                    emoji="▶"
-                )
-                
-                # Custom callback for navigation
-                async def next_callback(interaction: discord.Interaction):
-                    await self._navigate_to_page(interaction, self.current_page + 1)
-                
-                discord_next = await next_button.render()
-                discord_next.callback = next_callback
-                self.add_item(discord_next)
-                self._navigation_buttons.append(next_button)
-                
-        except Exception as e:
-            logger.error(f"Error adding navigation buttons: {e}")
+        
+        # Next page button
+        if self.current_page < self.total_pages - 1:
+            next_button = NavigationButton(
+                component_id="nav_next",
+                theme=self.theme,
+                label="Next ▶",
+                target_view="favorites",
+                current_page=self.current_page,
+                target_page=self.current_page + 1,
+                emoji="▶"
+            )
+        
+        # Render both navigation buttons concurrently
+        discord_prev, discord_next = await asyncio.gather(
+            prev_button.render() if prev_button else _no_button(),
+            next_button.render() if next_button else _no_button()
+        )
+        
+        if prev_button:
+            # Custom callback for navigation
+            discord_prev.callback = self._on_prev
+            self.add_item(discord_prev)
+            self._navigation_buttons.append(prev_button)
+        
+        # Page indicator (disabled button showing current page)
+        page_button = discord.ui.Button(
+            style=discord.ButtonStyle.secondary,
+            label=f"Page {self.current_page + 1}/{self.total_pages}",
+            emoji="📄",
+            disabled=True
+        )
+        self.add_item(page_button)
+        self._page_indicator = page_button
+        
+        if next_button:
+            # Custom callback for navigation
+            discord_next.callback = self._on_next
+            self.add_item(discord_next)
+            self._navigation_buttons.append(next_button)
     
     async def _add_action_buttons(self) -> None:
         """Add action buttons for managing favorites"""
-        try:
-            # Add favorite button
-            async def add_favorite_action(interaction: discord.Interaction, button: ActionButton):
-                # This would integrate with the existing add favorite functionality
+        # Add favorite button
+        async def add_favorite_action(interaction: discord.Interaction, button: ActionButton):
+            # This would integrate with the existing add favorite functionality
+            await interaction.followup.send(
+                "💡 Use `/set-favorite <url> [name]` to add a new favorite station!",
+                ephemeral=True
+            )
+        
+        add_button = ActionButton(
+            component_id="add_favorite",
+            theme=self.theme,
+            label="Add Favorite",
+            action=add_favorite_action,
+            confirm_required=False,
+            emoji="➕"
+        )
+        
+        self._action_buttons.append(add_button)
+        
+        # Remove favorite button (only if favorites exist)
+        if self._has_favorites:
+            async def remove_favorite_action(interaction: discord.Interaction, button: ActionButton):
                 await interaction.followup.send(
-                    "💡 Use `/set-favorite <url> [name]` to add a new favorite station!",
+                    "💡 Use `/remove-favorite <number>` to remove a favorite station!",
                     ephemeral=True
                 )
             
-            add_button = ActionButton(
-                component_id="add_favorite",
+            remove_button = ActionButton(
+                component_id="remove_favorite",
                 theme=self.theme,
-                label="Add Favorite",
-                action=add_favorite_action,
+                label="Remove Favorite",
+                action=remove_favorite_action,
                 confirm_required=False,
-                emoji="➕"
+                emoji="🗑️"
             )
             
-            discord_add = await add_button.render()
-            self.add_item(discord_add)
-            self._action_buttons.append(add_button)
+            # Set warning style for remove button
+            remove_button.custom_style = discord.ButtonStyle.secondary
             
-            # Remove favorite button (only if favorites exist)
-            if self.favorites_list:
-                async def remove_favorite_action(interaction: discord.Interaction, button: ActionButton):
-                    await interaction.followup.send(
-                        "💡 Use `/remove-favorite <number>` to remove a favorite station!",
-                        ephemeral=True
-                    )
-                
-                remove_button = ActionButton(
-                    component_id="remove_favorite",
-                    theme=self.theme,
-                    label="Remove Favorite",
-                    action=remove_favorite_action,
-                    confirm_required=False,
-                    emoji="🗑️"
-                )
-                
-                # Set warning style for remove button
-                remove_button.custom_style = discord.ButtonStyle.secondary
-                
-                discord_remove = await remove_button.render()
-                self.add_item(discord_remove)
-                self._action_buttons.append(remove_button)
-                
-        except Exception as e:
-            logger.error(f"Error adding action buttons: {e}")
+            self._action_buttons.append(remove_button)
+        
+        # Render concurrently, then add to view in order
+        rendered = await asyncio.gather(*(button.render() for button in self._action_buttons))
+        for discord_button in rendered:
+            self.add_item(discord_button)
+    
+    async def _on_prev(self, interaction: discord.Interaction) -> None:
+        """Previous page button callback"""
+        await self._navigate_to_page(interaction, self.current_page - 1)
+    
+    async def _on_next(self, interaction: discord.Interaction) -> None:
+        """Next page button callback"""
+        await self._navigate_to_page(interaction, self.current_page + 1)
     
     async def _navigate_to_page(self, interaction: discord.Interaction, new_page: int) -> None:
         """
@@ -241,9 +301,13 @@ class FavoritesView(BaseView):
                 )
                 return
             
+            # Acknowledge before rebuilding so a slow build cannot outlive the interaction
+            await interaction.response.defer()
+            
             # Update current page
             old_page = self.current_page
             self.current_page = new_page
+            self._compute_page_slice()
             
             # Rebuild view for new page
             await self._build_view()
@@ -251,7 +315,7 @@ class FavoritesView(BaseView):
             # Update the message with new view
             embed = self._create_favorites_embed()
             
-            await interaction.response.edit_message(
+            await interaction.edit_original_response(
                 embed=embed,
                 view=self
             )
@@ -260,10 +324,14 @@ class FavoritesView(BaseView):
             
         except Exception as e:
             logger.error(f"Error navigating to page {new_page}: {e}")
-            await interaction.response.send_message(
-                "❌ Error navigating to page. Please try again.",
-                ephemeral=True
-            )
+            error_message = "❌ Error navigating to page. Please try again."
+            try:
+                if interaction.response.is_done():
+                    await interaction.followup.send(error_message, ephemeral=True)
+                else:
+                    await interaction.response.send_message(error_message, ephemeral=True)
+            except discord.HTTPException as send_error:
+                logger.error(f"Failed to report navigation error: {send_error}")
     
     def _create_favorites_embed(self) -> discord.Embed:
         """
@@ -272,67 +340,44 @@ class FavoritesView(BaseView):
         Returns:
             Discord embed for favorites display
         """
-        try:
-            # Calculate page info
-            start_index = self.current_page * self.favorites_per_page
-            end_index = min(start_index + self.favorites_per_page, len(self.favorites_list))
-            
-            # Create embed
-            if not self.favorites_list:
-                embed = discord.Embed(
-                    title="📻 Favorite Stations",
-                    description="No favorites set for this server yet!\n\n"
-                               "Use `/set-favorite <url> [name]` to add your first favorite station.",
-                    color=discord.Color.from_str(self.theme.colors.primary)
-                )
+        # Create embed
+        if not self._has_favorites:
+            embed = discord.Embed(
+                title=self._title_base,
+                description="No favorites set for this server yet!\n\n"
+                           "Use `/set-favorite <url> [name]` to add your first favorite station.",
+                color=self._primary_color
+            )
+        else:
+            # Header and description with page info
+            if self._is_paginated:
+                title = f"{self._title_base} (Page {self.current_page + 1}/{self.total_pages})"
+                description = (f"{self._desc_header}\n"
+                               f"Showing favorites {self._page_start + 1}-{self._page_end}")
             else:
-                # Header with page info
-                title = f"📻 Favorite Stations"
-                if self.total_pages > 1:
-                    title += f" (Page {self.current_page + 1}/{self.total_pages})"
-                
-                # Description with current page favorites
-                description_lines = [
-                    f"**{len(self.favorites_list)} favorite stations** • Click a button to play!"
-                ]
-                
-                if self.total_pages > 1:
-                    description_lines.append(f"Showing favorites {start_index + 1}-{end_index}")
-                
-                embed = discord.Embed(
-                    title=title,
-                    description="\n".join(description_lines),
-                    color=discord.Color.from_str(self.theme.colors.primary)
-                )
-                
-                # Add favorite list as field (for reference)
-                favorites_text = []
-                for i in range(start_index, end_index):
-                    if i < len(self.favorites_list):
-                        fav = self.favorites_list[i]
-                        favorites_text.append(f"**{fav['favorite_number']}.** {fav['station_name']}")
-                
-                if favorites_text:
-                    embed.add_field(
-                        name="🎵 Current Page",
-                        value="\n".join(favorites_text),
-                        inline=False
-                    )
+                title = self._title_base
+                description = self._desc_header
             
-            # Footer with instructions
-            embed.set_footer(
-                text="💡 Use the buttons below to play favorites or manage your collection"
+            embed = discord.Embed(
+                title=title,
+                description=description,
+                color=self._primary_color
             )
             
-            return embed
-            
-        except Exception as e:
-            logger.error(f"Error creating favorites embed: {e}")
-            return discord.Embed(
-                title="📻 Favorite Stations",
-                description="❌ Error loading favorites",
-                color=discord.Color.red()
-            )
+            # Add favorite list as field (for reference)
+            if self._page_slice:
+                embed.add_field(
+                    name="🎵 Current Page",
+                    value="\n".join(self._formatted_labels[self._page_start:self._page_end]),
+                    inline=False
+                )
+        
+        # Footer with instructions
+        embed.set_footer(
+            text="💡 Use the buttons below to play favorites or manage your collection"
+        )
+        
+        return embed
     
     async def get_embed_and_view(self) -> tuple[discord.Embed, 'FavoritesView']:
         """
@@ -341,7 +386,15 @@ class FavoritesView(BaseView):
         Returns:
             Tuple of (embed, view) ready for Discord message
         """
-        embed = self._create_favorites_embed()
+        try:
+            embed = self._create_favorites_embed()
+        except Exception as e:
+            logger.error(f"Error creating favorites embed: {e}")
+            embed = discord.Embed(
+                title=self._title_base,
+                description="❌ Error loading favorites",
+                color=discord.Color.red()
+            )
         return embed, self
     
     def get_view_stats(self) -> Dict[str, Any]:
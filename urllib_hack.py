@@ -1,10 +1,22 @@
 import urllib.request
 import http
 import ssl
+from typing import Dict, Optional
+
+# Status line prefix sent by SHOUTCAST v1 servers
+_ICY_PREFIX = b"ICY"
 
 class IcylessHTTPResponse(http.client.HTTPResponse):
   # OVERRIDE _read_status to convert ICY status code to HTTP/1.0
   def _read_status(self):
+    # Plain HTTP responses need no patching; check the buffered prefix without consuming it
+    peek = getattr(self.fp, "peek", None)
+    if peek is not None:
+      first = peek(3)[:3]
+      # A short peek is inconclusive, so only delegate when all three bytes are known
+      if len(first) == 3 and first != _ICY_PREFIX:
+        return super()._read_status()
+
     line = str(self.fp.readline(http.client._MAXLINE + 1), "iso-8859-1")
     if len(line) > http.client._MAXLINE:
       raise http.client.LineTooLong("status line")
@@ -25,8 +37,9 @@ class IcylessHTTPResponse(http.client.HTTPResponse):
         # empty version will cause next test to fail.
         version = ""
     # OVERRIDE FROM http.client. Replace ICY with HTTP/1.0 for compatibility with SHOUTCAST v1
-    if version.startswith("ICY"):
-      version = version.replace("ICY", "HTTP/1.0")
+    # Only the leading "ICY" is rewritten, so slice rather than scan the whole token
+    if version[:3] == "ICY":
+      version = "HTTP/1.0" + version[3:]
 
     if not version.startswith("HTTP/"):
       self._close_conn()
@@ -59,17 +72,34 @@ class IcylessHTTPSHandler(urllib.request.HTTPSHandler):
   def https_open(self, req):
     return self.do_open(IcylessHTTPSConnection, req)
 
-def init_urllib_hack(tls_verify: bool):
+# tls_verify flag of the currently installed opener, and openers built so far per flag
+_installed_tls_verify: Optional[bool] = None
+_openers: Dict[bool, urllib.request.OpenerDirector] = {}
+
+def _build_opener(tls_verify: bool) -> urllib.request.OpenerDirector:
   # Create SSL context for HTTPS connections
   ctx = ssl._create_unverified_context()
   if not tls_verify:
     ctx.set_ciphers('DEFAULT:@SECLEVEL=1')
 
   # Create an opener with both HTTP and HTTPS handlers
-  opener = urllib.request.build_opener(
+  return urllib.request.build_opener(
     IcylessHTTPHandler(),              # For HTTP URLs
     IcylessHTTPSHandler(context=ctx)   # For HTTPS URLs
   )
 
+def init_urllib_hack(tls_verify: bool):
+  global _installed_tls_verify
+
+  # Already installed for this flag
+  if _installed_tls_verify == tls_verify:
+    return
+
+  # Build the SSL context and opener once per flag
+  opener = _openers.get(tls_verify)
+  if opener is None:
+    opener = _openers[tls_verify] = _build_opener(tls_verify)
+
   # Install opener as default opener
   urllib.request.install_opener(opener)
+  _installed_tls_verify = tls_verify
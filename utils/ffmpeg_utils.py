@@ -6,13 +6,58 @@ to ensure BunBot works out-of-the-box without system configuration.
 """
 
 import os
+import stat
+import json
+import hashlib
 import logging
 import shutil
+import subprocess
 from pathlib import Path
 from typing import Optional
 
+try:
+    import discord
+except ImportError:
+    discord = None
+
 logger = logging.getLogger('utils.ffmpeg_utils')
 
+# Project directories that may hold a local FFmpeg, as path components
+# relative to the project root, and the executable names looked for in them
+_LOCAL_FFMPEG_DIRS = (
+    ("ffmpeg-7.1.1-essentials_build", "bin"),
+    ("ffmpeg", "bin"),
+    ("bin",),
+    (),
+)
+_LOCAL_FFMPEG_NAMES = (
+    "ffmpeg.exe",  # Windows
+    "ffmpeg",      # Linux/Mac
+)
+
+# Common installation locations for this platform
+_WINDOWS_FFMPEG_PATHS = (
+    "C:\\ffmpeg\\bin\\ffmpeg.exe",
+    "C:\\Program Files\\ffmpeg\\bin\\ffmpeg.exe",
+    "C:\\Program Files (x86)\\ffmpeg\\bin\\ffmpeg.exe",
+)
+_POSIX_FFMPEG_PATHS = (
+    "/usr/bin/ffmpeg",
+    "/usr/local/bin/ffmpeg",
+    "/opt/ffmpeg/bin/ffmpeg",
+    "/snap/bin/ffmpeg",
+)
+_COMMON_FFMPEG_PATHS = _WINDOWS_FFMPEG_PATHS if os.name == 'nt' else _POSIX_FFMPEG_PATHS
+
+def _cache_file() -> Path:
+    """Location of the detection cache shared across bot restarts"""
+    cache_home = os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache'
+    return Path(cache_home) / 'soundbridge' / 'ffmpeg_path'
+
+def _path_env_hash() -> str:
+    """Stable hash of PATH; a change invalidates the detection cache"""
+    return hashlib.sha256(os.environ.get('PATH', '').encode('utf-8')).hexdigest()
+
 class FFmpegManager:
     """
     Manages FFmpeg detection and configuration for cross-platform compatibility.
@@ -32,6 +77,9 @@ class FFmpegManager:
         self._ffmpeg_path: Optional[str] = None
         self._detection_attempted = False
         
+        # '-version' output of the detected executable, captured once
+        self._version_output: Optional[str] = None
+        
         logger.debug(f"FFmpegManager initialized with project root: {self.project_root}")
     
     def get_ffmpeg_executable(self) -> Optional[str]:
@@ -47,6 +95,54 @@ class FFmpegManager:
         
         return self._ffmpeg_path
     
+    def _load_cached_path(self) -> bool:
+        """
+        Use the FFmpeg path recorded by an earlier run, if still valid.
+        
+        The entry must match this project root and PATH, and the recorded
+        executable must still be an executable file with the same
+        modification time. Local project FFmpeg is checked before the cache,
+        so only system and common-location results are cached.
+        
+        Returns:
+            True if the cached path was applied, False otherwise
+        """
+        try:
+            with open(_cache_file(), 'r', encoding='utf-8') as f:
+                cached = json.load(f)
+            
+            path = cached['path']
+            if (cached['project_root'] != str(self.project_root)
+                    or cached['path_hash'] != _path_env_hash()
+                    or not self._is_candidate(path)
+                    or os.stat(path).st_mtime != cached['mtime']):
+                return False
+            
+            self._ffmpeg_path = path
+            logger.info(f"Using cached FFmpeg location: {path}")
+            return True
+            
+        except (OSError, ValueError, KeyError, TypeError, RuntimeError):
+            return False
+    
+    def _save_cached_path(self) -> None:
+        """Record the detected FFmpeg path for later runs"""
+        try:
+            cache_file = _cache_file()
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            
+            entry = {
+                'path': self._ffmpeg_path,
+                'mtime': os.stat(self._ffmpeg_path).st_mtime,
+                'project_root': str(self.project_root),
+                'path_hash': _path_env_hash()
+            }
+            with open(cache_file, 'w', encoding='utf-8') as f:
+                json.dump(entry, f)
+                
+        except (OSError, RuntimeError) as e:
+            logger.debug(f"Could not save FFmpeg detection cache: {e}")
+    
     def _detect_ffmpeg(self) -> None:
         """Detect FFmpeg executable using multiple strategies"""
         try:
@@ -57,11 +153,16 @@ class FFmpegManager:
                 logger.info(f"Found local FFmpeg: {local_path}")
                 return
             
+            # Location recorded by an earlier run for the strategies below
+            if self._load_cached_path():
+                return
+            
             # Strategy 2: System PATH (fallback)
             system_path = self._find_system_ffmpeg()
             if system_path:
                 self._ffmpeg_path = system_path
                 logger.info(f"Found system FFmpeg: {system_path}")
+                self._save_cached_path()
                 return
             
             # Strategy 3: Common installation paths (last resort)
@@ -69,6 +170,7 @@ class FFmpegManager:
             if common_path:
                 self._ffmpeg_path = common_path
                 logger.info(f"Found FFmpeg in common location: {common_path}")
+                self._save_cached_path()
                 return
             
             logger.warning("FFmpeg not found in any location")
@@ -79,26 +181,24 @@ class FFmpegManager:
     def _find_local_ffmpeg(self) -> Optional[str]:
         """Find FFmpeg in local project directory"""
         try:
-            # Common local paths to check
+            # Check each directory once; missing ones (the usual case) skip their files
+            root = str(self.project_root)
+            local_dirs = [
+                directory for directory in (os.path.join(root, *parts) for parts in _LOCAL_FFMPEG_DIRS)
+                if os.path.isdir(directory)
+            ]
+            
+            # Candidates in priority order: Windows names in every directory, then Linux/Mac
             local_paths = [
-                # Windows
-                self.project_root / "ffmpeg-7.1.1-essentials_build" / "bin" / "ffmpeg.exe",
-                self.project_root / "ffmpeg" / "bin" / "ffmpeg.exe",
-                self.project_root / "bin" / "ffmpeg.exe",
-                self.project_root / "ffmpeg.exe",
-                
-                # Linux/Mac
-                self.project_root / "ffmpeg-7.1.1-essentials_build" / "bin" / "ffmpeg",
-                self.project_root / "ffmpeg" / "bin" / "ffmpeg",
-                self.project_root / "bin" / "ffmpeg",
-                self.project_root / "ffmpeg",
+                os.path.join(directory, name)
+                for name in _LOCAL_FFMPEG_NAMES
+                for directory in local_dirs
             ]
             
+            # Cheap stat checks first; only the first candidate found is run
             for path in local_paths:
-                if path.exists() and path.is_file():
-                    # Verify it's executable
-                    if self._verify_ffmpeg_executable(str(path)):
-                        return str(path.resolve())
+                if self._is_candidate(path) and self._probe_ffmpeg(path):
+                    return os.path.realpath(path)
             
             return None
             
@@ -109,13 +209,9 @@ class FFmpegManager:
     def _find_system_ffmpeg(self) -> Optional[str]:
         """Find FFmpeg in system PATH"""
         try:
-            # Use shutil.which for cross-platform PATH search
-            ffmpeg_path = shutil.which("ffmpeg")
-            
-            if ffmpeg_path and self._verify_ffmpeg_executable(ffmpeg_path):
-                return ffmpeg_path
-            
-            return None
+            # Use shutil.which for cross-platform PATH search; it only returns
+            # existing executable files, so the result is not run to verify it
+            return shutil.which("ffmpeg")
             
         except Exception as e:
             logger.error(f"Error finding system FFmpeg: {e}")
@@ -124,24 +220,8 @@ class FFmpegManager:
     def _find_common_ffmpeg(self) -> Optional[str]:
         """Find FFmpeg in common installation locations"""
         try:
-            # Windows common paths
-            if os.name == 'nt':
-                common_paths = [
-                    "C:\\ffmpeg\\bin\\ffmpeg.exe",
-                    "C:\\Program Files\\ffmpeg\\bin\\ffmpeg.exe",
-                    "C:\\Program Files (x86)\\ffmpeg\\bin\\ffmpeg.exe",
-                ]
-            else:
-                # Linux/Mac common paths
-                common_paths = [
-                    "/usr/bin/ffmpeg",
-                    "/usr/local/bin/ffmpeg",
-                    "/opt/ffmpeg/bin/ffmpeg",
-                    "/snap/bin/ffmpeg",
-                ]
-            
-            for path in common_paths:
-                if os.path.exists(path) and self._verify_ffmpeg_executable(path):
+            for path in _COMMON_FFMPEG_PATHS:
+                if self._is_candidate(path) and self._probe_ffmpeg(path):
                     return path
             
             return None
@@ -160,17 +240,48 @@ class FFmpegManager:
         Returns:
             True if valid FFmpeg executable, False otherwise
         """
-        try:
-            # Check if file exists and is executable
-            if not os.path.exists(path):
-                return False
+        return self._is_candidate(path) and self._probe_ffmpeg(path)
+    
+    def _is_candidate(self, path: str) -> bool:
+        """
+        Check whether a path looks like an FFmpeg executable without running it.
+        
+        Args:
+            path: Path to potential FFmpeg executable
             
+        Returns:
+            True if the path is an executable file, False otherwise
+        """
+        try:
             # On Windows, check for .exe extension
             if os.name == 'nt' and not path.lower().endswith('.exe'):
                 return False
             
-            # Try to run ffmpeg -version to verify it works
-            import subprocess
+            # One stat call answers both "exists" and "is a regular file"
+            try:
+                st = os.stat(path)
+            except FileNotFoundError:
+                return False
+            
+            return stat.S_ISREG(st.st_mode) and os.access(path, os.X_OK)
+            
+        except Exception as e:
+            logger.debug(f"Error checking FFmpeg candidate {path}: {e}")
+            return False
+    
+    def _probe_ffmpeg(self, path: str) -> bool:
+        """
+        Run the given executable with -version to confirm it is FFmpeg.
+        
+        The output of a successful probe is kept for get_ffmpeg_info().
+        
+        Args:
+            path: Path to an FFmpeg candidate
+            
+        Returns:
+            True if the executable identifies as FFmpeg, False otherwise
+        """
+        try:
             try:
                 result = subprocess.run(
                     [path, '-version'], 
@@ -181,6 +292,7 @@ class FFmpegManager:
                 
                 # Check if output contains FFmpeg identifier
                 if result.returncode == 0 and 'ffmpeg version' in result.stdout.lower():
+                    self._version_output = result.stdout
                     return True
                 
             except (subprocess.TimeoutExpired, subprocess.SubprocessError, FileNotFoundError):
@@ -209,8 +321,13 @@ class FFmpegManager:
         }
         
         if ffmpeg_path:
+            if self._version_output is not None:
+                # Reuse the output captured when the executable was verified
+                info['version'] = self._version_output.split('\n')[0]
+                info['working'] = True
+                return info
+            
             try:
-                import subprocess
                 result = subprocess.run(
                     [ffmpeg_path, '-version'], 
                     capture_output=True, 
@@ -220,6 +337,7 @@ class FFmpegManager:
                 
                 if result.returncode == 0:
                     # Extract version from output
+                    self._version_output = result.stdout
                     version_line = result.stdout.split('\n')[0]
                     info['version'] = version_line
                     info['working'] = True
@@ -247,9 +365,10 @@ class FFmpegManager:
         Raises:
             RuntimeError: If FFmpeg is not available
         """
+        if discord is None:
+            raise RuntimeError("discord.py is not available")
+        
         try:
-            import discord
-            
             ffmpeg_path = self.get_ffmpeg_executable()
             
             if not ffmpeg_path:
@@ -263,8 +382,6 @@ class FFmpegManager:
             # Create and return the audio source
             return discord.FFmpegPCMAudio(source, **kwargs)
             
-        except ImportError:
-            raise RuntimeError("discord.py is not available")
         except Exception as e:
             raise RuntimeError(f"Failed to create FFmpeg audio source: {e}")
 